@@ -1,15 +1,21 @@
+import os
 import sys
-import pandas as pd
+
+# Use the application's spreadsheet readers
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+import readers
 
 def analyze_excel_file(file_path):
     """Analyze an Excel file and print its structure and sample data"""
     try:
         print(f"\n--- ANALYZING EXCEL FILE: {file_path} ---\n")
         
-        # Read the Excel file
-        df = pd.read_excel(file_path)
+        # Read the Excel file with the fastest available reader
+        result = readers.read_report(file_path)
+        df = result.frame
         
         # Basic information
+        print(f"Reader: {result.engine} ({result.seconds:.3f}s)")
         print(f"Shape: {df.shape} (rows, columns)")
         print(f"Columns: {list(df.columns)}")
         print("\nData Types:")
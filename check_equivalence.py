@@ -0,0 +1,227 @@
+import argparse
+import datetime
+import os
+import random
+import sys
+import tempfile
+import time
+import warnings
+
+import numpy as np
+import openpyxl
+import pandas as pd
+
+# Use the application's export pipeline
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+import pipeline
+
+import legacy_export
+
+# Report shapes to compare. Each flag changes how the generated report looks:
+#   h        'Duration (h)' as HH:MM:SS text
+#   time     'Duration (h)' as datetime.time values
+#   decimal  'Duration (decimal)' hours
+#   nandec   some missing decimal durations
+#   nanproj  some entries without a project
+#   nanuser  some entries without a user
+#   strdate  dates as dd/mm/yyyy text instead of datetimes
+#   nouser / noemail / nodesc / noproject  drop those columns
+SHAPES = [
+    ['h', 'decimal'],
+    ['h'],
+    ['decimal'],
+    ['time'],
+    ['time', 'decimal', 'nandec'],
+    ['h', 'decimal', 'nandec', 'nanproj', 'nanuser'],
+    ['h', 'strdate', 'noemail'],
+    ['decimal', 'noemail', 'nodesc'],
+    ['h', 'nouser'],
+    ['h', 'noproject'],
+    [],
+]
+
+# The new exports must take at most this fraction of the legacy exports' time
+# on the performance report, including writing the workbook. projects.xlsx is
+# dominated by openpyxl writing the same cells, so it only must not get slower
+# (with a margin for timing noise).
+MAX_TIME_RATIO = {
+    'projects': 1.1,
+    'hr': 0.25,
+}
+
+# Names longer than 31 characters and with characters Excel doesn't allow in sheet names
+USERS = ['Alice', 'Bob', 'Carol ' + 'x' * 40, 'D/ave:?']
+PROJECTS = ['Proj A', 'Proj B', 'A very long project name exceeding thirty one chars', 'Z[1]', 'Proj*C']
+DESCRIPTIONS = ['Fix bug', 'fix bug ', 'Review', None, 'Meeting', 'Fix bug']
+
+
+def generate_report(rows, seed, shape):
+    """Generate a Clockify-like report with the given shape flags"""
+    rng = random.Random(seed)
+    users = USERS + [None] if 'nanuser' in shape else USERS
+    projects = PROJECTS + [None] if 'nanproj' in shape else PROJECTS
+
+    entries = []
+    for _ in range(rows):
+        day = datetime.datetime(2024, 1, 1) + datetime.timedelta(days=rng.randint(0, 30))
+        hours = round(rng.random() * 5, 2)
+        seconds = int(hours * 3600)
+        entry = {
+            'Project': rng.choice(projects),
+            'Client': 'Client',
+            'Description': rng.choice(DESCRIPTIONS),
+            'Task': 'Task',
+            'User': rng.choice(users),
+            'Email': 'user@example.com',
+            'Start Date': day,
+            'Start Time': '09:00:00',
+            'End Date': day,
+            'End Time': '10:00:00',
+        }
+        if 'h' in shape:
+            entry['Duration (h)'] = f"{seconds // 3600:02d}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}"
+        if 'time' in shape:
+            entry['Duration (h)'] = datetime.time(seconds // 3600, seconds % 3600 // 60, seconds % 60)
+        if 'decimal' in shape:
+            entry['Duration (decimal)'] = np.nan if 'nandec' in shape and rng.random() < 0.2 else hours
+        entries.append(entry)
+
+    df = pd.DataFrame(entries)
+    if 'strdate' in shape:
+        df['Start Date'] = df['Start Date'].dt.strftime('%d/%m/%Y')
+        df['End Date'] = df['End Date'].dt.strftime('%d/%m/%Y')
+    dropped = {'nouser': 'User', 'noemail': 'Email', 'nodesc': 'Description', 'noproject': 'Project'}
+    return df.drop(columns=[column for flag, column in dropped.items() if flag in shape])
+
+
+def new_export_projects(df, file_path):
+    """Write projects.xlsx the way the application does"""
+    sheets = pipeline.build_project_sheets(pipeline.normalize_report(df))
+    pipeline.write_outputs([(file_path, sheets, False)])
+
+
+def new_export_hr(df, file_path):
+    """Write hr.xlsx the way the application does"""
+    sheets = pipeline.build_hr_sheets(pipeline.normalize_report(df), pipeline.report_date_range(df))
+    pipeline.write_outputs([(file_path, sheets, False)])
+
+
+EXPORTS = [
+    ('projects', legacy_export.export_projects, new_export_projects),
+    ('hr', legacy_export.export_hr, new_export_hr),
+]
+
+
+def run_export(export, df, file_path):
+    """Run an export, returning the error it raised (None if it succeeded)"""
+    try:
+        export(df, file_path)
+    except Exception as e:
+        return e
+    return None
+
+
+def workbook_cells(file_path):
+    """Return the (sheet name, rows of cell values) of every sheet of a workbook"""
+    workbook = openpyxl.load_workbook(file_path)
+    return [(sheet.title, [[cell.value for cell in row] for row in sheet.iter_rows()])
+            for sheet in workbook.worksheets]
+
+
+def compare_workbooks(expected_path, actual_path):
+    """Return a description of the first difference between two workbooks, or None"""
+    expected = workbook_cells(expected_path)
+    actual = workbook_cells(actual_path)
+    expected_names = [name for name, _ in expected]
+    actual_names = [name for name, _ in actual]
+    if expected_names != actual_names:
+        return f"sheets differ: expected {expected_names}, got {actual_names}"
+
+    for (name, expected_rows), (_, actual_rows) in zip(expected, actual):
+        if len(expected_rows) != len(actual_rows):
+            return f"sheet '{name}': expected {len(expected_rows)} rows, got {len(actual_rows)}"
+        for row, (expected_row, actual_row) in enumerate(zip(expected_rows, actual_rows), start=1):
+            if expected_row != actual_row:
+                return f"sheet '{name}' row {row}: expected {expected_row}, got {actual_row}"
+    return None
+
+
+def check_equivalence(directory, rows, seed):
+    """Compare the legacy and new exports on every report shape, returning the number of failures"""
+    failures = 0
+    for i, shape in enumerate(SHAPES):
+        df = generate_report(rows, seed + i, shape)
+        for name, legacy, new in EXPORTS:
+            expected_path = os.path.join(directory, f"{i}_{name}_legacy.xlsx")
+            actual_path = os.path.join(directory, f"{i}_{name}_new.xlsx")
+            expected_error = run_export(legacy, df.copy(), expected_path)
+            actual_error = run_export(new, df.copy(), actual_path)
+
+            if expected_error is not None or actual_error is not None:
+                # Reports the legacy export can't process must still fail (the messages may differ)
+                if (expected_error is None) == (actual_error is None):
+                    problem = None
+                else:
+                    problem = f"expected error {expected_error!r}, got {actual_error!r}"
+            else:
+                problem = compare_workbooks(expected_path, actual_path)
+
+            label = f"{name:<8} {'+'.join(shape) or 'no durations'}"
+            if problem:
+                failures += 1
+                print(f"  FAIL  {label}: {problem}")
+            elif expected_error is not None:
+                print(f"  ok    {label} (both fail)")
+            else:
+                print(f"  ok    {label}")
+    return failures
+
+
+def check_performance(directory, rows, seed):
+    """Time the legacy and new exports on a large report, returning the number of failures"""
+    df = generate_report(rows, seed, ['h', 'decimal'])
+    failures = 0
+    for name, legacy, new in EXPORTS:
+        timings = []
+        for label, export in [('legacy', legacy), ('new', new)]:
+            start = time.perf_counter()
+            export(df.copy(), os.path.join(directory, f"performance_{name}_{label}.xlsx"))
+            timings.append(time.perf_counter() - start)
+
+        ratio = timings[1] / timings[0]
+        passed = ratio <= MAX_TIME_RATIO[name]
+        failures += not passed
+        print(f"  {'ok  ' if passed else 'FAIL'}  {name:<8} legacy {timings[0]:7.2f}s  new {timings[1]:7.2f}s  "
+              f"ratio {ratio:.2f} (max {MAX_TIME_RATIO[name]:.2f})")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Check that the exports produce exactly the original projects.xlsx and hr.xlsx, and are faster"
+    )
+    parser.add_argument("--rows", type=int, default=300, help="rows of each generated report shape")
+    parser.add_argument("--performance-rows", type=int, default=20000, help="rows of the performance report")
+    parser.add_argument("--seed", type=int, default=0, help="random seed of the generated reports")
+    parser.add_argument("--skip-performance", action="store_true", help="only compare the workbooks")
+    args = parser.parse_args()
+
+    # The legacy exports trigger pandas deprecation warnings on every sheet, and
+    # both parse text dates for the total label the same (warned about) way
+    warnings.simplefilter("ignore", FutureWarning)
+    warnings.simplefilter("ignore", UserWarning)
+
+    with tempfile.TemporaryDirectory() as directory:
+        print(f"Comparing exports on {len(SHAPES)} report shapes ({args.rows} rows each)")
+        failures = check_equivalence(directory, args.rows, args.seed)
+
+        if not args.skip_performance:
+            print(f"\nTiming exports on {args.performance_rows} rows")
+            failures += check_performance(directory, args.performance_rows, args.seed)
+
+    print(f"\n{'FAILED' if failures else 'PASSED'} ({failures} failures)")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,486 @@
+"""Frozen copy of the original projects.xlsx and hr.xlsx exports, used as the reference by check_equivalence.py
+
+The function bodies are the original ResponsiveApp.export_projects and
+export_hr code with only the dialogs, progress bar and status bar calls
+removed. Do not change them: they define the expected output.
+"""
+import pandas as pd
+
+
+def export_projects(clockify_data, file_path):
+    """Export project-based summary to projects.xlsx with dedicated sheets for each project"""
+    df = clockify_data.copy()
+
+    # Required columns for the projects.xlsx format
+    required_columns = [
+        'Project', 'Description', 'User', 'Email', 
+        'Start Date', 'Start Time', 'End Date', 'End Time', 'Duration (h)'
+    ]
+
+    # Create a writer to save multiple sheets
+    with pd.ExcelWriter(file_path, engine='openpyxl') as writer:
+        # Create a main sheet with all projects
+        main_df = pd.DataFrame(columns=required_columns)
+
+        # Map existing columns to the target format
+        if 'Project' in df.columns:
+            main_df['Project'] = df['Project']
+        else:
+            main_df['Project'] = None
+
+        if 'Description' in df.columns:
+            main_df['Description'] = df['Description']
+        else:
+            main_df['Description'] = None
+
+        if 'User' in df.columns:
+            main_df['User'] = df['User']
+        else:
+            main_df['User'] = None
+
+        if 'Email' in df.columns:
+            main_df['Email'] = df['Email']
+        else:
+            main_df['Email'] = None
+
+        # Handle date and time columns
+        if 'Start Date' in df.columns:
+            main_df['Start Date'] = df['Start Date']
+            if pd.api.types.is_datetime64_any_dtype(df['Start Date']):
+                main_df['Start Date'] = df['Start Date'].dt.strftime('%d/%m/%Y')
+        else:
+            main_df['Start Date'] = None
+
+        if 'Start Time' in df.columns:
+            main_df['Start Time'] = df['Start Time']
+        else:
+            main_df['Start Time'] = None
+
+        if 'End Date' in df.columns:
+            main_df['End Date'] = df['End Date']
+            if pd.api.types.is_datetime64_any_dtype(df['End Date']):
+                main_df['End Date'] = df['End Date'].dt.strftime('%d/%m/%Y')
+        else:
+            main_df['End Date'] = None
+
+        if 'End Time' in df.columns:
+            main_df['End Time'] = df['End Time']
+        else:
+            main_df['End Time'] = None
+
+        # Handle duration
+        if 'Duration (h)' in df.columns:
+            main_df['Duration (h)'] = df['Duration (h)']
+        elif 'Duration (decimal)' in df.columns:
+            # Convert decimal hours to HH:MM:SS format
+            def decimal_to_time(decimal_hours):
+                if pd.isna(decimal_hours):
+                    return None
+                hours = int(decimal_hours)
+                minutes = int((decimal_hours - hours) * 60)
+                seconds = int(((decimal_hours - hours) * 60 - minutes) * 60)
+                return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+
+            main_df['Duration (h)'] = df['Duration (decimal)'].apply(decimal_to_time)
+        else:
+            # Try to extract duration from time entries if available
+            main_df['Duration (h)'] = "00:00:00"
+
+
+        # Calculate total duration for all entries
+        total_duration_seconds = 0
+
+        # Process durations in HH:MM:SS format
+        for duration in main_df['Duration (h)']:
+            if pd.notna(duration) and isinstance(duration, str):
+                try:
+                    h, m, s = map(int, duration.split(':'))
+                    total_duration_seconds += h * 3600 + m * 60 + s
+                except (ValueError, AttributeError):
+                    pass
+            elif pd.notna(duration) and hasattr(duration, 'hour'):
+                # Handle time objects
+                total_duration_seconds += duration.hour * 3600 + duration.minute * 60 + duration.second
+
+        # Convert total seconds to HH:MM:SS
+        total_hours = total_duration_seconds // 3600
+        remaining_seconds = total_duration_seconds % 3600
+        total_minutes = remaining_seconds // 60
+        total_seconds = remaining_seconds % 60
+        total_duration_str = f"{total_hours:02d}:{total_minutes:02d}:{total_seconds:02d}"
+
+        # Add total row to main sheet
+        blank_row = pd.Series([None] * len(main_df.columns), index=main_df.columns)
+        main_df = pd.concat([main_df, pd.DataFrame([blank_row])], ignore_index=True)
+
+        total_row = pd.Series([None] * len(main_df.columns), index=main_df.columns)
+        total_row['Project'] = 'Total:'
+        total_row['Duration (h)'] = total_duration_str
+        main_df = pd.concat([main_df, pd.DataFrame([total_row])], ignore_index=True)
+
+        # Skip creating the 'All Projects' sheet as per user request
+
+        # Group by Project and create a sheet for each project
+        # Get unique project names while preserving order
+        unique_projects = []
+        for project in df['Project']:
+            if project not in unique_projects and not pd.isna(project):
+                unique_projects.append(project)
+
+        project_count = len(unique_projects)
+        current_project = 0
+
+        for project_name in unique_projects:
+            current_project += 1
+            progress = 50 + (current_project / project_count) * 40
+
+            # Filter data for this project without groupby to preserve duplicates
+            project_data = df[df['Project'] == project_name].copy()
+
+            # Create a dataframe for this project
+            project_df = pd.DataFrame(columns=required_columns)
+
+            # Fill in the data for this project (preserve all entries including duplicates)
+            for col in required_columns:
+                if col in project_data.columns:
+                    project_df[col] = project_data[col]
+
+                    # Format dates if needed
+                    if col in ['Start Date', 'End Date'] and pd.api.types.is_datetime64_any_dtype(project_data[col]):
+                        project_df[col] = project_data[col].dt.strftime('%d/%m/%Y')
+                else:
+                    project_df[col] = None
+
+            # Handle duration for this project
+            if 'Duration (h)' in project_data.columns:
+                project_df['Duration (h)'] = project_data['Duration (h)']
+            elif 'Duration (decimal)' in project_data.columns:
+                project_df['Duration (h)'] = project_data['Duration (decimal)'].apply(decimal_to_time)
+
+            # Calculate total duration for this project
+            project_duration_seconds = 0
+            for duration in project_df['Duration (h)']:
+                if pd.notna(duration) and isinstance(duration, str):
+                    try:
+                        h, m, s = map(int, duration.split(':'))
+                        project_duration_seconds += h * 3600 + m * 60 + s
+                    except (ValueError, AttributeError):
+                        pass
+                elif pd.notna(duration) and hasattr(duration, 'hour'):
+                    project_duration_seconds += duration.hour * 3600 + duration.minute * 60 + duration.second
+
+            # Convert project total seconds to HH:MM:SS
+            project_hours = project_duration_seconds // 3600
+            remaining = project_duration_seconds % 3600
+            project_minutes = remaining // 60
+            project_seconds = remaining % 60
+            project_duration_str = f"{project_hours:02d}:{project_minutes:02d}:{project_seconds:02d}"
+
+            # Add total row to project sheet
+            blank_row = pd.Series([None] * len(project_df.columns), index=project_df.columns)
+            project_df = pd.concat([project_df, pd.DataFrame([blank_row])], ignore_index=True)
+
+            total_row = pd.Series([None] * len(project_df.columns), index=project_df.columns)
+            total_row['Project'] = 'Total:'
+            total_row['Duration (h)'] = project_duration_str
+            project_df = pd.concat([project_df, pd.DataFrame([total_row])], ignore_index=True)
+
+            # Save project sheet - use a valid sheet name (max 31 chars, no special chars)
+            sheet_name = str(project_name)[:31].replace('/', '_').replace('\\', '_').replace('?', '_').replace('*', '_').replace('[', '_').replace(']', '_').replace(':', '_')
+            project_df.to_excel(writer, sheet_name=sheet_name, index=False)
+
+
+def export_hr(clockify_data, file_path):
+    """Export HR-friendly timesheet to hr.xlsx with dedicated sheets for each person"""
+    df = clockify_data.copy()
+
+    # Required columns for HR format
+    required_columns = ['Project', 'Description', 'Time (h)']
+
+    # Create a writer to save multiple sheets
+    with pd.ExcelWriter(file_path, engine='openpyxl') as writer:
+        # Create a main sheet with all entries
+        all_rows = []
+        grand_total_seconds = 0
+
+        # Group by Project to get the main entries
+        project_groups = df.groupby('Project')
+
+        for project_name, project_data in project_groups:
+            if pd.isna(project_name):
+                continue
+
+            # Calculate total time for this project
+            project_seconds = 0
+
+            # Try to get duration from different possible columns
+            if 'Duration (decimal)' in project_data.columns:
+                # Convert decimal hours to seconds
+                for hours in project_data['Duration (decimal)']:
+                    if pd.notna(hours):
+                        project_seconds += int(hours * 3600)
+            elif 'Duration (h)' in project_data.columns:
+                # Parse HH:MM:SS format
+                for duration in project_data['Duration (h)']:
+                    if pd.notna(duration) and isinstance(duration, str):
+                        try:
+                            h, m, s = map(int, duration.split(':'))
+                            project_seconds += h * 3600 + m * 60 + s
+                        except (ValueError, AttributeError):
+                            pass
+                    elif pd.notna(duration) and hasattr(duration, 'hour'):
+                        # Handle time objects
+                        project_seconds += duration.hour * 3600 + duration.minute * 60 + duration.second
+
+            # Convert project seconds to HH:MM:SS
+            project_hours = project_seconds // 3600
+            remaining = project_seconds % 3600
+            project_minutes = remaining // 60
+            project_seconds_remainder = remaining % 60
+            project_time_str = f"{project_hours:02d}:{project_minutes:02d}:{project_seconds_remainder:02d}"
+
+            # Add to grand total
+            grand_total_seconds += project_seconds
+
+            # Add the main project row
+            project_row = {
+                'Project': project_name,
+                'Description': None,
+                'Time (h)': project_time_str
+            }
+            all_rows.append(project_row)
+
+            # Group entries by description and sum their durations
+            desc_groups = {}
+
+            for idx, row in project_data.iterrows():
+                desc = row.get('Description')
+                if pd.notna(desc):  # Only process if description is not NA
+                    # Get duration for this individual entry
+                    entry_seconds = 0
+
+                    if 'Duration (decimal)' in project_data.columns and pd.notna(row.get('Duration (decimal)')):
+                        entry_seconds = int(row.get('Duration (decimal)') * 3600)
+                    elif 'Duration (h)' in project_data.columns and pd.notna(row.get('Duration (h)')):
+                        duration = row.get('Duration (h)')
+                        if isinstance(duration, str):
+                            try:
+                                h, m, s = map(int, duration.split(':'))
+                                entry_seconds = h * 3600 + m * 60 + s
+                            except (ValueError, AttributeError):
+                                pass
+                        elif hasattr(duration, 'hour'):
+                            entry_seconds = duration.hour * 3600 + duration.minute * 60 + duration.second
+
+                    # Add to the description group total
+                    if desc in desc_groups:
+                        desc_groups[desc] += entry_seconds
+                    else:
+                        desc_groups[desc] = entry_seconds
+
+            # Create a row for each unique description with summed duration
+            for desc, total_seconds in desc_groups.items():
+                # Convert total seconds to HH:MM:SS
+                total_hours = total_seconds // 3600
+                remaining = total_seconds % 3600
+                total_minutes = remaining // 60
+                total_seconds_remainder = remaining % 60
+                total_time_str = f"{total_hours:02d}:{total_minutes:02d}:{total_seconds_remainder:02d}"
+
+                desc_row = {
+                    'Project': None,
+                    'Description': desc,
+                    'Time (h)': total_time_str
+                }
+                all_rows.append(desc_row)
+
+        # Create the DataFrame from all rows
+        hr_df = pd.DataFrame(all_rows)
+
+
+        # Get date range for the total row
+        start_date = None
+        end_date = None
+        if 'Start Date' in df.columns and not df['Start Date'].empty:
+            if pd.api.types.is_datetime64_any_dtype(df['Start Date']):
+                start_date = df['Start Date'].min().strftime('%d/%m/%Y')
+            else:
+                # Try to parse the date strings
+                try:
+                    dates = pd.to_datetime(df['Start Date'])
+                    start_date = dates.min().strftime('%d/%m/%Y')
+                except:
+                    pass
+
+        if 'End Date' in df.columns and not df['End Date'].empty:
+            if pd.api.types.is_datetime64_any_dtype(df['End Date']):
+                end_date = df['End Date'].max().strftime('%d/%m/%Y')
+            else:
+                # Try to parse the date strings
+                try:
+                    dates = pd.to_datetime(df['End Date'])
+                    end_date = dates.max().strftime('%d/%m/%Y')
+                except:
+                    pass
+
+        # Convert grand total seconds to HH:MM:SS
+        grand_total_hours = grand_total_seconds // 3600
+        remaining = grand_total_seconds % 3600
+        grand_total_minutes = remaining // 60
+        grand_total_seconds_remainder = remaining % 60
+        grand_total_str = f"{grand_total_hours:02d}:{grand_total_minutes:02d}:{grand_total_seconds_remainder:02d}"
+
+        # Add total row with date range if available
+        date_range = ""
+        if start_date and end_date:
+            date_range = f"Total ({start_date} - {end_date})"
+        else:
+            date_range = "Total"
+
+        # Add blank row before total
+        blank_row = pd.Series([None] * len(required_columns), index=required_columns)
+        hr_df = pd.concat([hr_df, pd.DataFrame([blank_row])], ignore_index=True)
+
+        # Add total row
+        total_row = pd.Series([None] * len(required_columns), index=required_columns)
+        total_row['Project'] = date_range
+        total_row['Time (h)'] = f"Total:\n{grand_total_str}"
+        hr_df = pd.concat([hr_df, pd.DataFrame([total_row])], ignore_index=True)
+
+        # Skip creating the 'All Entries' sheet as per user request
+
+        # Create sheets for each person
+        if 'User' in df.columns:
+            user_groups = df.groupby('User')
+            user_count = len(user_groups)
+            current_user = 0
+
+            for user_name, user_data in user_groups:
+                if pd.isna(user_name):
+                    continue
+
+                current_user += 1
+                progress = 50 + (current_user / user_count) * 40
+
+                # Create a dataframe for this user
+                user_rows = []
+                user_total_seconds = 0
+
+                # Group by Project for this user
+                user_project_groups = user_data.groupby('Project')
+
+                for project_name, project_data in user_project_groups:
+                    if pd.isna(project_name):
+                        continue
+
+                    # Calculate total time for this project
+                    project_seconds = 0
+
+                    # Try to get duration from different possible columns
+                    if 'Duration (decimal)' in project_data.columns:
+                        for hours in project_data['Duration (decimal)']:
+                            if pd.notna(hours):
+                                project_seconds += int(hours * 3600)
+                    elif 'Duration (h)' in project_data.columns:
+                        for duration in project_data['Duration (h)']:
+                            if pd.notna(duration) and isinstance(duration, str):
+                                try:
+                                    h, m, s = map(int, duration.split(':'))
+                                    project_seconds += h * 3600 + m * 60 + s
+                                except (ValueError, AttributeError):
+                                    pass
+                            elif pd.notna(duration) and hasattr(duration, 'hour'):
+                                project_seconds += duration.hour * 3600 + duration.minute * 60 + duration.second
+
+                    # Convert project seconds to HH:MM:SS
+                    project_hours = project_seconds // 3600
+                    remaining = project_seconds % 3600
+                    project_minutes = remaining // 60
+                    project_seconds_remainder = remaining % 60
+                    project_time_str = f"{project_hours:02d}:{project_minutes:02d}:{project_seconds_remainder:02d}"
+
+                    # Add to user total
+                    user_total_seconds += project_seconds
+
+                    # Add the main project row
+                    project_row = {
+                        'Project': project_name,
+                        'Description': None,
+                        'Time (h)': project_time_str
+                    }
+                    user_rows.append(project_row)
+
+                    # Group entries by description and sum their durations
+                    desc_groups = {}
+
+                    for idx, row in project_data.iterrows():
+                        desc = row.get('Description')
+                        if pd.notna(desc):  # Only process if description is not NA
+                            # Get duration for this individual entry
+                            entry_seconds = 0
+
+                            if 'Duration (decimal)' in project_data.columns and pd.notna(row.get('Duration (decimal)')):
+                                entry_seconds = int(row.get('Duration (decimal)') * 3600)
+                            elif 'Duration (h)' in project_data.columns and pd.notna(row.get('Duration (h)')):
+                                duration = row.get('Duration (h)')
+                                if isinstance(duration, str):
+                                    try:
+                                        h, m, s = map(int, duration.split(':'))
+                                        entry_seconds = h * 3600 + m * 60 + s
+                                    except (ValueError, AttributeError):
+                                        pass
+                                elif hasattr(duration, 'hour'):
+                                    entry_seconds = duration.hour * 3600 + duration.minute * 60 + duration.second
+
+                            # Add to the description group total
+                            if desc in desc_groups:
+                                desc_groups[desc] += entry_seconds
+                            else:
+                                desc_groups[desc] = entry_seconds
+
+                    # Create a row for each unique description with summed duration
+                    for desc, total_seconds in desc_groups.items():
+                        # Convert total seconds to HH:MM:SS
+                        total_hours = total_seconds // 3600
+                        remaining = total_seconds % 3600
+                        total_minutes = remaining // 60
+                        total_seconds_remainder = remaining % 60
+                        total_time_str = f"{total_hours:02d}:{total_minutes:02d}:{total_seconds_remainder:02d}"
+
+                        desc_row = {
+                            'Project': None,
+                            'Description': desc,
+                            'Time (h)': total_time_str
+                        }
+                        user_rows.append(desc_row)
+
+                # Create the DataFrame for this user
+                user_df = pd.DataFrame(user_rows)
+
+                # Convert user total seconds to HH:MM:SS
+                user_total_hours = user_total_seconds // 3600
+                remaining = user_total_seconds % 3600
+                user_total_minutes = remaining // 60
+                user_total_seconds_remainder = remaining % 60
+                user_total_str = f"{user_total_hours:02d}:{user_total_minutes:02d}:{user_total_seconds_remainder:02d}"
+
+                # Add blank row before total
+                if not user_df.empty:
+                    blank_row = pd.Series([None] * len(required_columns), index=required_columns)
+                    user_df = pd.concat([user_df, pd.DataFrame([blank_row])], ignore_index=True)
+
+                    # Add total row with date range if available
+                    date_range = ""
+                    if start_date and end_date:
+                        date_range = f"Total ({start_date} - {end_date})"
+                    else:
+                        date_range = "Total"
+
+                    total_row = pd.Series([None] * len(required_columns), index=required_columns)
+                    total_row['Project'] = date_range
+                    total_row['Time (h)'] = f"Total:\n{user_total_str}"
+                    user_df = pd.concat([user_df, pd.DataFrame([total_row])], ignore_index=True)
+
+                    # Save user sheet - use a valid sheet name (max 31 chars, no special chars)
+                    sheet_name = str(user_name)[:31].replace('/', '_').replace('\\', '_').replace('?', '_').replace('*', '_').replace('[', '_').replace(']', '_').replace(':', '_')
+                    user_df.to_excel(writer, sheet_name=sheet_name, index=False)
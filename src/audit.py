@@ -0,0 +1,104 @@
+import numpy as np
+import pandas as pd
+
+import pipeline
+
+# Columns of the audit report
+AUDIT_COLUMNS = [
+    'Issue', 'User', 'Project', 'Description', 'Start', 'End', 'Duration (h)',
+    'Conflicts With', 'Conflict Start', 'Conflict End', 'Overlap (h)'
+]
+
+DUPLICATE = 'Duplicate'
+OVERLAP = 'Overlap'
+
+
+def audit_entries(normalized):
+    """Find duplicate and overlapping time entries of each user
+
+    Entries are sorted by user, start and end once (O(n log n)) and swept with
+    a running maximum of the end times per user: an entry overlaps an earlier
+    one when it starts before that maximum. Exact duplicates (same user,
+    project, description, start and end) are reported as duplicates rather
+    than overlaps. Entries without a user or start time are skipped; a missing
+    end time is taken from the duration.
+    """
+    start = normalized['start']
+    end = normalized['end'].fillna(start + pd.to_timedelta(normalized['duration_seconds'], unit='s'))
+    valid = (normalized['User'].notna() & start.notna()).to_numpy()
+
+    entries = normalized.loc[valid, ['User', 'Project', 'Description', 'Duration (h)', 'duration_seconds']]
+    entries = entries.assign(start=start[valid], end=end[valid])
+    if entries.empty:
+        return pd.DataFrame(columns=AUDIT_COLUMNS)
+
+    users, _ = pd.factorize(entries['User'])
+    starts = entries['start'].to_numpy(dtype='datetime64[ns]').view(np.int64)
+    ends = entries['end'].to_numpy(dtype='datetime64[ns]').view(np.int64)
+    order = np.lexsort((ends, starts, users))
+    entries = entries.iloc[order].reset_index(drop=True)
+    users, starts, ends = users[order], starts[order], ends[order]
+
+    # Exact duplicates of an earlier entry, and the position of the first entry with the same key
+    keys = entries.groupby(['User', 'Project', 'Description', 'start', 'end'], sort=False, dropna=False).ngroup().to_numpy()
+    _, first_positions = np.unique(keys, return_index=True)
+    duplicated_position = first_positions[keys]
+    duplicate = duplicated_position != np.arange(len(entries))
+
+    # Running maximum end time of each user's entries, and the entry that set it.
+    # Every user's first entry sets its own maximum, so the position never leaks across users.
+    running_end = pd.Series(ends).groupby(users).cummax().to_numpy()
+    positions = np.arange(len(entries))
+    max_position = np.maximum.accumulate(np.where(ends == running_end, positions, 0))
+
+    # Shift by one entry within each user to compare with the previous entries only
+    first = np.ones(len(entries), dtype=bool)
+    first[1:] = users[1:] != users[:-1]
+    previous_end = np.empty_like(running_end)
+    previous_end[1:] = running_end[:-1]
+    previous_end[first] = np.iinfo(np.int64).min
+    previous_position = np.empty_like(positions)
+    previous_position[1:] = max_position[:-1]
+    previous_position[first] = -1
+
+    overlap = ~duplicate & (starts < previous_end)
+    flagged = np.flatnonzero(duplicate | overlap)
+
+    # The earlier entry each finding conflicts with: the duplicated entry for
+    # duplicates, the overlapped entry ending last for overlaps
+    conflict_position = np.where(duplicate, duplicated_position, previous_position)[flagged]
+    others = entries.iloc[conflict_position]
+    conflicts = others['Project'].fillna('').astype(str) + ' - ' + others['Description'].fillna('').astype(str)
+
+    conflict_end = ends[conflict_position]
+    overlap_seconds = np.maximum(np.minimum(ends[flagged], conflict_end) - starts[flagged], 0) // 10**9
+
+    findings = entries.iloc[flagged]
+    return pd.DataFrame({
+        'Issue': np.where(duplicate[flagged], DUPLICATE, OVERLAP),
+        'User': findings['User'].to_numpy(),
+        'Project': findings['Project'].to_numpy(),
+        'Description': findings['Description'].to_numpy(),
+        'Start': findings['start'].to_numpy(),
+        'End': findings['end'].to_numpy(),
+        'Duration (h)': pipeline.format_seconds_column(findings['duration_seconds']),
+        'Conflicts With': conflicts.to_numpy(),
+        'Conflict Start': others['start'].to_numpy(),
+        'Conflict End': others['end'].to_numpy(),
+        'Overlap (h)': pipeline.format_seconds_column(overlap_seconds),
+    })
+
+
+def audit_summary(findings):
+    """Return a one line summary of the audit findings"""
+    duplicates = int((findings['Issue'] == DUPLICATE).sum())
+    overlaps = int((findings['Issue'] == OVERLAP).sum())
+    return f"Found {duplicates} duplicate and {overlaps} overlapping entries"
+
+
+def write_audit(findings, file_path):
+    """Write the audit findings to a .csv file or an Excel workbook with an Audit sheet"""
+    if file_path.lower().endswith('.csv'):
+        findings.to_csv(file_path, index=False)
+    else:
+        pipeline.write_workbook(file_path, [pipeline.Sheet('Audit', findings, 0)])
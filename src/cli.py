@@ -0,0 +1,210 @@
+import argparse
+import os
+import sys
+
+import audit
+import compare
+import description_groups
+import pipeline
+import readers
+import rounding
+
+
+def load_report(file_path, engine=None):
+    """Load a report with the fastest available reader, printing the engine and load time"""
+    print(f"Loading file: {file_path}")
+    result = readers.read_report(file_path, engine)
+    print(f"Loaded {len(result.frame)} records from {os.path.basename(file_path)} "
+          f"in {result.seconds:.2f}s ({result.engine})")
+    return result.frame
+
+
+def load_rules(file_path):
+    """Load billing rounding rules from a text file (None if no file was given)"""
+    if not file_path:
+        return None
+    with open(file_path, encoding="utf-8") as rules_file:
+        return rounding.RoundingRules.parse(rules_file.read())
+
+
+def description_grouping(args):
+    """Return the description grouping requested on the command line, or None"""
+    if not args.group_descriptions and args.ticket_pattern is None:
+        return None
+    return description_groups.DescriptionGrouping(args.ticket_pattern)
+
+
+def export_all_command(args):
+    """Write projects.xlsx and hr.xlsx for a report without the GUI"""
+    os.makedirs(args.output_dir, exist_ok=True)
+    shard_hr = args.split in ("hr", "all")
+    shard_projects = args.split == "all"
+    projects_path = pipeline.output_path(args.output_dir, "projects", shard_projects, args.zip)
+    hr_path = pipeline.output_path(args.output_dir, "hr", shard_hr, args.zip)
+
+    rules = load_rules(args.rounding_rules)
+    df = load_report(args.report, args.engine)
+
+    def show_progress(value):
+        print(f"\rExporting... {int(value):3d}%", end="", flush=True)
+
+    project_sheets, hr_sheets = pipeline.export_all(
+        df, projects_path, hr_path, progress=show_progress, numeric=args.numeric_durations,
+        shard_projects=shard_projects, shard_hr=shard_hr, rules=rules,
+        grouping=description_grouping(args)
+    )
+    print()
+    print(f"Projects report saved to {projects_path} ({len(project_sheets)} {'workbooks' if shard_projects else 'sheets'})")
+    print(f"HR report saved to {hr_path} ({len(hr_sheets)} {'workbooks' if shard_hr else 'sheets'})")
+    return 0
+
+
+def export_data_command(args):
+    """Write the aggregated report as machine-readable tables"""
+    rules = load_rules(args.rounding_rules)
+    df = load_report(args.report, args.engine)
+
+    for path in pipeline.export_tables(df, args.output_dir, args.format, rules=rules,
+                                       grouping=description_grouping(args)):
+        print(f"Saved {path}")
+    return 0
+
+
+def audit_command(args):
+    """Report duplicate and overlapping time entries"""
+    df = load_report(args.report, args.engine)
+
+    findings = audit.audit_entries(pipeline.normalize_report(df))
+    audit.write_audit(findings, args.output)
+    print(audit.audit_summary(findings))
+    print(f"Audit report saved to {args.output}")
+    return 0
+
+
+def compare_command(args):
+    """Compare two reports, or two date ranges of one report"""
+    previous_range = tuple(args.previous_range or (None, None))
+    current_range = tuple(args.current_range or (None, None))
+    if args.current is None and previous_range == current_range:
+        raise ValueError("Give a second report or two different date ranges to compare")
+
+    previous = load_report(args.previous, args.engine)
+    current = previous if args.current is None else load_report(args.current, args.engine)
+
+    descriptions, projects, users = compare.compare_reports(previous, current, previous_range, current_range)
+    compare.write_comparison(args.output, descriptions, projects, users)
+    print(compare.comparison_summary(descriptions))
+    print(f"Comparison report saved to {args.output}")
+    return 0
+
+
+def benchmark_read_command(args):
+    """Time loading a report with every available reader engine"""
+    print(f"Benchmarking readers for {args.report}")
+    for engine, seconds, rows, identical in readers.benchmark_readers(args.report):
+        status = "same output" if identical else "DIFFERENT OUTPUT"
+        print(f"  {engine:<10} {seconds:8.3f}s  {rows} rows  {status}")
+    return 0
+
+
+def add_grouping_arguments(parser):
+    """Add the description grouping options to a command"""
+    parser.add_argument(
+        "--group-descriptions", action="store_true",
+        help="sum descriptions that differ only in case or spacing together"
+    )
+    parser.add_argument(
+        "--ticket-pattern", nargs="?", const=description_groups.DEFAULT_TICKET_PATTERN, metavar="REGEX",
+        help="sum descriptions mentioning the same ticket ID together "
+             f"(default pattern: {description_groups.DEFAULT_TICKET_PATTERN})"
+    )
+
+
+def build_parser():
+    """Create the command line parser"""
+    parser = argparse.ArgumentParser(
+        prog="main.py",
+        description="Process Clockify reports without the GUI (run without arguments to start the app)"
+    )
+    parser.add_argument(
+        "--engine", help="spreadsheet reader engine (default: fastest available, see benchmark-read)"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    export_all_parser = subparsers.add_parser("export-all", help="export projects.xlsx and hr.xlsx in one pass")
+    export_all_parser.add_argument("report", help="Clockify Excel report")
+    export_all_parser.add_argument("-o", "--output-dir", default=".", help="folder for the exported reports")
+    export_all_parser.add_argument(
+        "--numeric-durations", action="store_true",
+        help="write durations as numeric Excel times ([h]:mm:ss) instead of text"
+    )
+    export_all_parser.add_argument(
+        "--split", choices=["none", "hr", "all"], default="none",
+        help="write one workbook per person (hr) or per person and per project (all), with a manifest of totals"
+    )
+    export_all_parser.add_argument(
+        "--zip", action="store_true", help="pack split workbooks into hr.zip / projects.zip instead of folders"
+    )
+    export_all_parser.add_argument(
+        "--rounding-rules", metavar="FILE",
+        help="billing rounding rules, one 'scope: mode minutes' per line (e.g. 'default: up 15')"
+    )
+    add_grouping_arguments(export_all_parser)
+    export_all_parser.set_defaults(func=export_all_command)
+
+    export_data_parser = subparsers.add_parser(
+        "export-data", help="export project entries and description totals as CSV, JSON Lines or Parquet"
+    )
+    export_data_parser.add_argument("report", help="Clockify Excel report")
+    export_data_parser.add_argument("-o", "--output-dir", default=".", help="folder for the exported tables")
+    export_data_parser.add_argument(
+        "-f", "--format", choices=pipeline.TABLE_FORMATS, default="csv",
+        help="table format (parquet needs pyarrow)"
+    )
+    export_data_parser.add_argument(
+        "--rounding-rules", metavar="FILE", help="billing rounding rules (see export-all)"
+    )
+    add_grouping_arguments(export_data_parser)
+    export_data_parser.set_defaults(func=export_data_command)
+
+    audit_parser = subparsers.add_parser("audit", help="report duplicate and overlapping entries of each person")
+    audit_parser.add_argument("report", help="Clockify Excel report")
+    audit_parser.add_argument("-o", "--output", default="audit.xlsx", help="audit report (.xlsx or .csv)")
+    audit_parser.set_defaults(func=audit_command)
+
+    compare_parser = subparsers.add_parser(
+        "compare", help="compare hours per description, project and person between two periods"
+    )
+    compare_parser.add_argument("previous", help="Clockify Excel report of the previous period")
+    compare_parser.add_argument(
+        "current", nargs="?", help="Clockify Excel report of the current period (default: the previous report)"
+    )
+    compare_parser.add_argument("-o", "--output", default="comparison.xlsx", help="comparison workbook")
+    compare_parser.add_argument(
+        "--previous-range", nargs=2, metavar=("FROM", "TO"), help="only compare entries starting in this date range"
+    )
+    compare_parser.add_argument(
+        "--current-range", nargs=2, metavar=("FROM", "TO"), help="date range of the current period"
+    )
+    compare_parser.set_defaults(func=compare_command)
+
+    benchmark_parser = subparsers.add_parser(
+        "benchmark-read", help="time loading a report with every available reader engine"
+    )
+    benchmark_parser.add_argument("report", help="Clockify Excel report")
+    benchmark_parser.set_defaults(func=benchmark_read_command)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        return args.func(args)
+    except Exception as e:
+        print(f"\nError: {str(e)}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
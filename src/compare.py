@@ -0,0 +1,122 @@
+import numpy as np
+import pandas as pd
+
+import pipeline
+
+# Status of a description, project or person in the comparison
+NEW = 'New'
+REMOVED = 'Removed'
+CHANGED = 'Changed'
+UNCHANGED = 'Unchanged'
+
+KEYS = ['User', 'Project', 'Description']
+
+
+def format_changes(seconds):
+    """Format an array of signed seconds as +HH:MM:SS / -HH:MM:SS strings"""
+    signs = pd.Series(np.where(seconds < 0, '-', '+'), dtype=object)
+    return (signs + pipeline.format_seconds_column(np.abs(seconds))).to_numpy()
+
+
+def filter_period(normalized, start=None, end=None):
+    """Return the entries starting between start and end (inclusive dates), or all of them"""
+    mask = np.ones(len(normalized), dtype=bool)
+    if start is not None:
+        mask &= (normalized['start'] >= pd.Timestamp(start)).to_numpy()
+    if end is not None:
+        # Include the whole end day
+        mask &= (normalized['start'] < pd.Timestamp(end) + pd.Timedelta(days=1)).to_numpy()
+    return normalized[mask]
+
+
+def period_totals(normalized):
+    """Aggregate a period to total seconds per (user, project, description)"""
+    totals = pipeline.build_totals_table(normalized)
+    # Entries without a description are joined on an empty description
+    totals['Description'] = totals['Description'].fillna('')
+    return totals[KEYS + ['Seconds']]
+
+
+def _delta_frame(keys, previous, current, in_previous=None, in_current=None):
+    """Build a delta table from key columns and previous/current seconds, largest change first
+
+    in_previous and in_current tell which rows exist in each period (default: rows with time).
+    """
+    change = current - previous
+    if in_previous is None:
+        in_previous = previous != 0
+    if in_current is None:
+        in_current = current != 0
+    status = np.select(
+        [~in_previous, ~in_current, change != 0],
+        [NEW, REMOVED, CHANGED],
+        UNCHANGED
+    )
+    delta = keys.assign(**{
+        'Status': status,
+        'Previous (h)': pipeline.format_seconds_column(previous),
+        'Current (h)': pipeline.format_seconds_column(current),
+        'Change (h)': format_changes(change),
+        'Previous (seconds)': previous,
+        'Current (seconds)': current,
+        'Change (seconds)': change,
+    })
+    order = np.argsort(-np.abs(change), kind='stable')
+    return delta.iloc[order].reset_index(drop=True)
+
+
+def compare_periods(previous, current):
+    """Compare two normalized periods
+
+    Both periods are aggregated to (user, project, description) seconds and
+    hash-joined on those keys. Returns the changed descriptions (new, removed
+    or with different hours) and the total change per project and per user,
+    each sorted by the size of the change.
+    """
+    joined = pd.merge(
+        period_totals(previous), period_totals(current),
+        on=KEYS, how='outer', suffixes=(' previous', ' current')
+    )
+    previous_seconds = joined['Seconds previous'].fillna(0).to_numpy(dtype=np.int64)
+    current_seconds = joined['Seconds current'].fillna(0).to_numpy(dtype=np.int64)
+
+    # Descriptions logged in a single period are new or removed even if they took no time
+    descriptions = _delta_frame(
+        joined[KEYS], previous_seconds, current_seconds,
+        joined['Seconds previous'].notna().to_numpy(), joined['Seconds current'].notna().to_numpy()
+    )
+    descriptions = descriptions[descriptions['Status'] != UNCHANGED].reset_index(drop=True)
+
+    summaries = []
+    for key in ['Project', 'User']:
+        sums = pd.DataFrame({
+            key: joined[key], 'previous': previous_seconds, 'current': current_seconds
+        }).groupby(key, sort=True)[['previous', 'current']].sum()
+        summaries.append(_delta_frame(
+            sums.index.to_frame(index=False),
+            sums['previous'].to_numpy(), sums['current'].to_numpy()
+        ))
+    return descriptions, summaries[0], summaries[1]
+
+
+def compare_reports(previous_df, current_df, previous_range=(None, None), current_range=(None, None)):
+    """Normalize two reports (or one report holding both periods) and compare the given date ranges"""
+    previous = pipeline.normalize_report(previous_df)
+    current = previous if current_df is previous_df else pipeline.normalize_report(current_df)
+    return compare_periods(filter_period(previous, *previous_range), filter_period(current, *current_range))
+
+
+def comparison_summary(descriptions):
+    """Return a one line summary of the changed descriptions"""
+    counts = descriptions['Status'].value_counts()
+    return (f"{counts.get(NEW, 0)} new, {counts.get(REMOVED, 0)} removed and "
+            f"{counts.get(CHANGED, 0)} changed descriptions")
+
+
+def write_comparison(file_path, descriptions, projects, users):
+    """Write the comparison to a workbook with Changes, Projects and People sheets"""
+    pipeline.write_workbook(file_path, [
+        pipeline.Sheet('Changes', descriptions, 0),
+        pipeline.Sheet('Projects', projects, 0),
+        pipeline.Sheet('People', users, 0),
+    ])
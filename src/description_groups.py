@@ -0,0 +1,66 @@
+import re
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+# Jira style ticket IDs such as PROJ-123
+DEFAULT_TICKET_PATTERN = r'\b[A-Z][A-Z0-9]+-\d+\b'
+
+# How descriptions are grouped: always ignoring case and extra whitespace, and
+# optionally by the ticket ID matched by ticket_pattern (its first group if it has one)
+DescriptionGrouping = namedtuple('DescriptionGrouping', ['ticket_pattern'], defaults=[None])
+
+WHITESPACE = re.compile(r'\s+')
+
+
+def compile_pattern(ticket_pattern):
+    """Compile a ticket ID pattern, raising ValueError if it is not a valid regular expression"""
+    try:
+        return re.compile(ticket_pattern)
+    except re.error as e:
+        raise ValueError(f"Invalid ticket ID pattern '{ticket_pattern}': {e}")
+
+
+def clean_description(text):
+    """Strip a description and collapse runs of whitespace to single spaces"""
+    return WHITESPACE.sub(' ', str(text)).strip()
+
+
+def description_key(text, pattern=None):
+    """Return the grouping key of a cleaned description: its ticket ID if it has one, else the text itself"""
+    if pattern is not None:
+        match = pattern.search(text)
+        if match:
+            return 'ticket:' + (match.group(1) if pattern.groups else match.group(0)).casefold()
+    return text.casefold()
+
+
+def group_descriptions(descriptions, grouping=DescriptionGrouping()):
+    """Group a description column, working on the distinct descriptions only
+
+    Returns a Categorical whose integer codes identify the groups (missing
+    descriptions stay missing). Each group is labelled with its first
+    description, cleaned of extra whitespace.
+    """
+    pattern = compile_pattern(grouping.ticket_pattern) if grouping.ticket_pattern else None
+
+    codes, uniques = pd.factorize(descriptions)
+    cleaned = [clean_description(text) for text in uniques]
+    group_codes, _ = pd.factorize(pd.Series([description_key(text, pattern) for text in cleaned], dtype=object))
+
+    # Label each group with its first distinct description (uniques are in order of appearance)
+    _, first = np.unique(group_codes, return_index=True)
+    labels = [cleaned[i] for i in first]
+
+    # Missing descriptions have code -1, which picks the trailing -1 slot
+    row_codes = np.append(group_codes, -1)[codes]
+    return pd.Categorical.from_codes(row_codes, categories=labels)
+
+
+def apply_grouping(normalized, grouping=DescriptionGrouping()):
+    """Add the description_group column used by hr.xlsx and the description totals
+
+    projects.xlsx keeps listing every entry with its original description.
+    """
+    return normalized.assign(description_group=group_descriptions(normalized['Description'], grouping))
@@ -1,16 +1,43 @@
 import sys
 import os
 import signal
-import pandas as pd
-from datetime import datetime, timedelta
+import multiprocessing
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                              QHBoxLayout, QPushButton, QLabel, QLineEdit,
                              QListWidget, QListWidgetItem, QFrame, QSplitter,
                              QMessageBox, QSizePolicy, QFileDialog, QProgressBar,
-                             QStatusBar, QTableWidget, QTableWidgetItem, QHeaderView)
-from PyQt5.QtCore import Qt, QSize
+                             QStatusBar, QTableWidget, QTableWidgetItem, QHeaderView,
+                             QCheckBox, QComboBox, QDateEdit, QPlainTextEdit)
+from PyQt5.QtCore import Qt, QSize, QDate, QThread, pyqtSignal
 from PyQt5.QtGui import QFont
 
+import audit
+import compare
+import description_groups
+import pipeline
+import readers
+import rounding
+from search_index import ReportIndex
+
+# Number of rows shown in the data preview
+PREVIEW_ROWS = 100
+
+class ReportLoader(QThread):
+    """Load a whole report and build its search indexes in a background thread"""
+    loaded = pyqtSignal(object, object)
+    failed = pyqtSignal(str)
+    
+    def __init__(self, file_path, parent=None):
+        super().__init__(parent)
+        self.file_path = file_path
+    
+    def run(self):
+        try:
+            result = readers.read_report(self.file_path)
+            self.loaded.emit(result, ReportIndex(result.frame))
+        except Exception as e:
+            self.failed.emit(str(e))
+
 class ResponsiveApp(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -48,7 +75,10 @@ class ResponsiveApp(QMainWindow):
         
         # Initialize data variables
         self.clockify_data = None
+        self.report_index = None
+        self.load_info = ""
         self.input_file_path = None
+        self.loader = None
         
     def create_sidebar(self):
         # Sidebar
@@ -105,7 +135,11 @@ class ResponsiveApp(QMainWindow):
             {"name": "View Data", "action": self.view_data},
             {"name": "Export Projects", "action": self.export_projects},
             {"name": "Export HR", "action": self.export_hr},
-            {"name": "Settings", "action": None}
+            {"name": "Export All", "action": self.export_all},
+            {"name": "Export Data", "action": self.export_data},
+            {"name": "Audit Entries", "action": self.audit_entries},
+            {"name": "Compare Reports", "action": self.compare_reports},
+            {"name": "Settings", "action": self.show_settings}
         ]
         
         for btn in nav_buttons:
@@ -200,6 +234,9 @@ class ResponsiveApp(QMainWindow):
         
         self.content_layout.addWidget(self.welcome_widget)
         
+        # Filter bar for the data preview (initially hidden)
+        self.create_filter_bar()
+        
         # Table widget for data preview (initially hidden)
         self.table_widget = QTableWidget()
         self.table_widget.setHidden(True)
@@ -224,8 +261,123 @@ class ResponsiveApp(QMainWindow):
         self.export_hr_btn.clicked.connect(self.export_hr)
         self.export_layout.addWidget(self.export_hr_btn)
         
+        self.export_all_btn = QPushButton("Export All")
+        self.export_all_btn.clicked.connect(self.export_all)
+        self.export_layout.addWidget(self.export_all_btn)
+        
+        self.export_data_btn = QPushButton("Export Data")
+        self.export_data_btn.clicked.connect(self.export_data)
+        self.export_layout.addWidget(self.export_data_btn)
+        
+        self.audit_btn = QPushButton("Audit Entries")
+        self.audit_btn.clicked.connect(self.audit_entries)
+        self.export_layout.addWidget(self.audit_btn)
+        
+        self.compare_btn = QPushButton("Compare With Previous")
+        self.compare_btn.clicked.connect(self.compare_reports)
+        self.export_layout.addWidget(self.compare_btn)
+        
         self.export_widget.setHidden(True)
         self.content_layout.addWidget(self.export_widget)
+        
+        # Settings panel (initially hidden)
+        self.create_settings()
+    
+    def create_filter_bar(self):
+        # Live search and facets over the imported data
+        self.filter_widget = QWidget()
+        filter_layout = QHBoxLayout(self.filter_widget)
+        filter_layout.setContentsMargins(0, 0, 0, 0)
+        
+        self.search_input = QLineEdit()
+        self.search_input.setPlaceholderText("Search descriptions...")
+        self.search_input.textChanged.connect(self.apply_filter)
+        filter_layout.addWidget(self.search_input, 3)
+        
+        self.user_filter = QComboBox()
+        self.user_filter.currentIndexChanged.connect(self.apply_filter)
+        filter_layout.addWidget(self.user_filter, 1)
+        
+        self.project_filter = QComboBox()
+        self.project_filter.currentIndexChanged.connect(self.apply_filter)
+        filter_layout.addWidget(self.project_filter, 1)
+        
+        self.date_from_filter = QDateEdit()
+        self.date_from_filter.setCalendarPopup(True)
+        self.date_from_filter.setDisplayFormat("dd/MM/yyyy")
+        self.date_from_filter.dateChanged.connect(self.apply_filter)
+        filter_layout.addWidget(self.date_from_filter)
+        
+        self.date_to_filter = QDateEdit()
+        self.date_to_filter.setCalendarPopup(True)
+        self.date_to_filter.setDisplayFormat("dd/MM/yyyy")
+        self.date_to_filter.dateChanged.connect(self.apply_filter)
+        filter_layout.addWidget(self.date_to_filter)
+        
+        clear_button = QPushButton("Clear")
+        clear_button.clicked.connect(self.clear_filters)
+        filter_layout.addWidget(clear_button)
+        
+        self.filter_widget.setHidden(True)
+        self.content_layout.addWidget(self.filter_widget)
+    
+    def create_settings(self):
+        # Export options shown by the Settings button
+        self.settings_widget = QWidget()
+        settings_layout = QVBoxLayout(self.settings_widget)
+        
+        settings_label = QLabel("Settings")
+        settings_label.setStyleSheet("font-size: 24px; font-weight: bold;")
+        settings_layout.addWidget(settings_label)
+        
+        self.numeric_durations_checkbox = QCheckBox("Write durations as numeric Excel times ([h]:mm:ss) instead of text")
+        self.numeric_durations_checkbox.setToolTip("Lets Excel sum duration columns; totals are numeric cells with highlighted rows")
+        settings_layout.addWidget(self.numeric_durations_checkbox)
+        
+        split_label = QLabel("Output layout:")
+        settings_layout.addWidget(split_label)
+        
+        self.split_output_combo = QComboBox()
+        self.split_output_combo.addItems([
+            "One workbook per report",
+            "One workbook per person (HR)",
+            "One workbook per person (HR) and per project (Projects)"
+        ])
+        settings_layout.addWidget(self.split_output_combo)
+        
+        self.zip_shards_checkbox = QCheckBox("Pack split workbooks into a zip archive instead of a folder")
+        settings_layout.addWidget(self.zip_shards_checkbox)
+        
+        data_format_label = QLabel("Export Data format:")
+        settings_layout.addWidget(data_format_label)
+        
+        self.data_format_combo = QComboBox()
+        self.data_format_combo.addItems(["CSV", "JSON Lines", "Parquet (requires pyarrow)"])
+        settings_layout.addWidget(self.data_format_combo)
+        
+        rounding_label = QLabel("Billing rounding rules (leave empty to export raw durations only):")
+        settings_layout.addWidget(rounding_label)
+        
+        self.rounding_rules_input = QPlainTextEdit()
+        self.rounding_rules_input.setPlaceholderText(rounding.RULES_HELP)
+        self.rounding_rules_input.setToolTip("Entries are rounded before summing; exports show a Rounded (h) column next to the raw durations")
+        settings_layout.addWidget(self.rounding_rules_input)
+        
+        self.group_descriptions_checkbox = QCheckBox("Group descriptions that differ only in case or spacing (HR report and data export)")
+        settings_layout.addWidget(self.group_descriptions_checkbox)
+        
+        ticket_label = QLabel("Group descriptions by ticket ID matching (leave empty to disable):")
+        settings_layout.addWidget(ticket_label)
+        
+        self.ticket_pattern_input = QLineEdit()
+        self.ticket_pattern_input.setPlaceholderText(f"e.g. {description_groups.DEFAULT_TICKET_PATTERN}")
+        self.ticket_pattern_input.setToolTip("Regular expression; descriptions mentioning the same ticket are summed together")
+        settings_layout.addWidget(self.ticket_pattern_input)
+        
+        settings_layout.addStretch()
+        
+        self.settings_widget.setHidden(True)
+        self.content_layout.addWidget(self.settings_widget)
     
     def import_excel(self):
         """Import a Clockify Excel report file"""
@@ -240,33 +392,110 @@ class ResponsiveApp(QMainWindow):
             return
             
         self.input_file_path = file_path
+        self.clockify_data = None
+        self.report_index = None
         self.status_bar.showMessage(f"Loading file: {os.path.basename(file_path)}")
         
         try:
             # Show progress
             self.progress_bar.setHidden(False)
-            self.progress_bar.setValue(25)
-            
-            # Load the Excel file
-            self.clockify_data = pd.read_excel(file_path)
-            
-            # Update progress
-            self.progress_bar.setValue(100)
-            
-            # Show data preview
-            self.display_data_preview()
+            self.progress_bar.setValue(10)
             
-            # Show export buttons
-            self.export_widget.setHidden(False)
+            # Read the header and first page straight away so the preview doesn't wait for the whole file
+            preview = readers.read_preview(file_path, PREVIEW_ROWS)
+            self.display_first_page(preview.frame)
             
-            # Update status
-            self.status_bar.showMessage(f"Loaded {len(self.clockify_data)} records from {os.path.basename(file_path)}")
+            # Load the rest in the background, exports stay disabled until it is done
+            self.progress_bar.setRange(0, 0)
+            self.status_bar.showMessage(f"Showing the first {len(preview.frame)} rows, loading the rest of {os.path.basename(file_path)}...")
+            self.loader = ReportLoader(file_path, self)
+            self.loader.loaded.connect(self.finish_import)
+            self.loader.failed.connect(self.import_failed)
+            self.loader.finished.connect(self.loader.deleteLater)
+            self.loader.start()
             
         except Exception as e:
+            # Drop any earlier load still running, its data would show under this file's name
+            self.loader = None
+            self.input_file_path = None
+            self.progress_bar.setRange(0, 100)
             self.progress_bar.setHidden(True)
             QMessageBox.critical(self, "Error", f"Failed to load file: {str(e)}")
             self.status_bar.showMessage("Error loading file")
     
+    def finish_import(self, result, report_index):
+        """Show the whole report once the background load is done"""
+        # Ignore a load superseded by a newer import
+        if self.sender() is not self.loader:
+            return
+        self.loader = None
+        
+        self.clockify_data = result.frame
+        self.report_index = report_index
+        self.load_info = f"in {result.seconds:.2f}s ({result.engine})"
+        self.populate_filters()
+        
+        self.progress_bar.setRange(0, 100)
+        self.progress_bar.setHidden(True)
+        
+        # Show data preview
+        self.display_data_preview()
+        
+        # Enable filtering and exports
+        self.filter_widget.setEnabled(True)
+        self.export_widget.setEnabled(True)
+        
+        # Update status
+        self.status_bar.showMessage(f"Loaded {len(self.clockify_data)} records from {os.path.basename(self.input_file_path)} {self.load_info}")
+    
+    def import_failed(self, message):
+        """Report a background load error"""
+        if self.sender() is not self.loader:
+            return
+        self.loader = None
+        
+        self.progress_bar.setRange(0, 100)
+        self.progress_bar.setHidden(True)
+        QMessageBox.critical(self, "Error", f"Failed to load file: {message}")
+        self.status_bar.showMessage("Error loading file")
+    
+    def check_data_loaded(self):
+        """Return True if a whole report is loaded, otherwise tell the user why not"""
+        if self.clockify_data is not None:
+            return True
+        if self.loader is not None:
+            QMessageBox.information(self, "Loading", "The report is still loading, please try again in a moment.")
+        else:
+            QMessageBox.warning(self, "No Data", "Please import a Clockify report first.")
+        return False
+    
+    def display_first_page(self, preview_data):
+        """Show the first rows of a report while the rest is loading"""
+        self.welcome_widget.setHidden(True)
+        self.settings_widget.setHidden(True)
+        self.table_widget.setHidden(False)
+        self.filter_widget.setHidden(False)
+        self.export_widget.setHidden(False)
+        
+        # Filters and exports need the whole report
+        self.filter_widget.setEnabled(False)
+        self.export_widget.setEnabled(False)
+        
+        self.table_widget.setColumnCount(len(preview_data.columns))
+        self.table_widget.setHorizontalHeaderLabels([str(col) for col in preview_data.columns])
+        self.fill_table(preview_data)
+        self.table_widget.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+    
+    def fill_table(self, preview_data):
+        """Fill the table widget with the given rows"""
+        values = preview_data.to_numpy(dtype=object)
+        self.table_widget.setRowCount(len(preview_data))
+        for row in range(len(preview_data)):
+            for col in range(len(preview_data.columns)):
+                value = str(values[row, col])
+                item = QTableWidgetItem(value)
+                self.table_widget.setItem(row, col, item)
+    
     def display_data_preview(self):
         """Display a preview of the loaded data in the table widget"""
         if self.clockify_data is None:
@@ -274,22 +503,15 @@ class ResponsiveApp(QMainWindow):
             
         # Hide welcome widget and show table
         self.welcome_widget.setHidden(True)
+        self.settings_widget.setHidden(True)
         self.table_widget.setHidden(False)
         
-        # Get the first 100 rows for preview
-        preview_data = self.clockify_data.head(100)
+        self.filter_widget.setHidden(False)
         
         # Set up table
-        self.table_widget.setRowCount(len(preview_data))
-        self.table_widget.setColumnCount(len(preview_data.columns))
-        self.table_widget.setHorizontalHeaderLabels(preview_data.columns)
-        
-        # Populate table
-        for row in range(len(preview_data)):
-            for col in range(len(preview_data.columns)):
-                value = str(preview_data.iloc[row, col])
-                item = QTableWidgetItem(value)
-                self.table_widget.setItem(row, col, item)
+        self.table_widget.setColumnCount(len(self.clockify_data.columns))
+        self.table_widget.setHorizontalHeaderLabels([str(col) for col in self.clockify_data.columns])
+        self.apply_filter()
         
         # Resize columns to contents
         self.table_widget.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
@@ -299,27 +521,122 @@ class ResponsiveApp(QMainWindow):
         summary_label.setStyleSheet("font-size: 14px;")
         self.status_bar.showMessage(summary_label.text())
     
+    def populate_filters(self):
+        """Fill the filter bar with the users, projects and date range of the imported data"""
+        filters = [self.search_input, self.user_filter, self.project_filter,
+                   self.date_from_filter, self.date_to_filter]
+        for widget in filters:
+            widget.blockSignals(True)
+        
+        self.search_input.clear()
+        self.user_filter.clear()
+        self.user_filter.addItem("All users")
+        self.user_filter.addItems(self.report_index.users)
+        self.project_filter.clear()
+        self.project_filter.addItem("All projects")
+        self.project_filter.addItems(self.report_index.projects)
+        
+        has_dates = self.report_index.min_date is not None
+        for date_filter in [self.date_from_filter, self.date_to_filter]:
+            date_filter.setEnabled(has_dates)
+            if has_dates:
+                date_filter.setDateRange(QDate(self.report_index.min_date.date()), QDate(self.report_index.max_date.date()))
+        if has_dates:
+            self.date_from_filter.setDate(QDate(self.report_index.min_date.date()))
+            self.date_to_filter.setDate(QDate(self.report_index.max_date.date()))
+        
+        for widget in filters:
+            widget.blockSignals(False)
+    
+    def clear_filters(self):
+        """Reset the filter bar to show all entries"""
+        if self.clockify_data is not None:
+            self.populate_filters()
+            self.apply_filter()
+    
+    def apply_filter(self):
+        """Show the entries matching the filter bar, using the indexes built at import"""
+        if self.clockify_data is None:
+            return
+        
+        # The first combo box entry means no filter
+        user = self.user_filter.currentText() if self.user_filter.currentIndex() > 0 else None
+        project = self.project_filter.currentText() if self.project_filter.currentIndex() > 0 else None
+        
+        # Only filter on dates when the range was narrowed, so entries without a date stay visible
+        start = end = None
+        if self.report_index.min_date is not None:
+            date_from = self.date_from_filter.date().toPyDate()
+            date_to = self.date_to_filter.date().toPyDate()
+            if date_from > self.report_index.min_date.date():
+                start = date_from
+            if date_to < self.report_index.max_date.date():
+                end = date_to
+        
+        rows = self.report_index.search(self.search_input.text(), user, project, start, end)
+        preview_data = self.clockify_data.iloc[rows[:PREVIEW_ROWS]]
+        
+        # Populate table
+        self.fill_table(preview_data)
+        
+        if len(rows) < len(self.clockify_data):
+            self.status_bar.showMessage(f"Showing {len(preview_data)} of {len(rows)} matching entries")
+        else:
+            self.status_bar.showMessage(f"Loaded {len(self.clockify_data)} time entries from {os.path.basename(self.input_file_path)}")
+    
     def view_data(self):
         """Switch to data view"""
-        if self.clockify_data is not None:
+        if self.clockify_data is not None or self.loader is not None:
             self.welcome_widget.setHidden(True)
+            self.settings_widget.setHidden(True)
+            self.filter_widget.setHidden(False)
             self.table_widget.setHidden(False)
             self.export_widget.setHidden(False)
     
+    def show_settings(self):
+        """Switch to the settings panel"""
+        self.welcome_widget.setHidden(True)
+        self.filter_widget.setHidden(True)
+        self.table_widget.setHidden(True)
+        self.export_widget.setHidden(True)
+        self.settings_widget.setHidden(False)
+    
+    def rounding_rules(self):
+        """Return the billing rounding rules from the settings (raises ValueError if invalid)"""
+        return rounding.RoundingRules.parse(self.rounding_rules_input.toPlainText())
+    
+    def description_grouping(self):
+        """Return the description grouping chosen in the settings, or None to keep exact descriptions"""
+        ticket_pattern = self.ticket_pattern_input.text().strip()
+        if not self.group_descriptions_checkbox.isChecked() and not ticket_pattern:
+            return None
+        return description_groups.DescriptionGrouping(ticket_pattern or None)
+    
+    def normalize_data(self):
+        """Normalize the imported report, applying the rounding rules and description grouping, if any"""
+        return pipeline.prepare_report(self.clockify_data, self.rounding_rules(), self.description_grouping())
+    
+    def get_output_path(self, title, name, sharded):
+        """Ask where to save a report: a workbook, or a zip archive or the name subfolder of a folder for split output"""
+        if not sharded:
+            file_path, _ = QFileDialog.getSaveFileName(self, title, f"{name}.xlsx", "Excel Files (*.xlsx)")
+            return file_path
+        if self.zip_shards_checkbox.isChecked():
+            file_path, _ = QFileDialog.getSaveFileName(self, title, f"{name}.zip", "Zip Archives (*.zip)")
+            return file_path
+        # Each report gets its own subfolder, so its manifest and workbooks don't mix with another export's
+        output_dir = QFileDialog.getExistingDirectory(self, title)
+        return pipeline.output_path(output_dir, name, True, False) if output_dir else output_dir
+    
     def export_projects(self):
         """Export project-based summary to projects.xlsx with dedicated sheets for each project"""
-        if self.clockify_data is None:
-            QMessageBox.warning(self, "No Data", "Please import a Clockify report first.")
+        if not self.check_data_loaded():
             return
             
         try:
             # Get save file location
-            file_path, _ = QFileDialog.getSaveFileName(
-                self, 
-                "Save Projects Report", 
-                "projects.xlsx", 
-                "Excel Files (*.xlsx)"
-            )
+            sharded = self.split_output_combo.currentIndex() == 2
+            file_path = self.get_output_path("Save Projects Report", "projects", sharded)
             
             if not file_path:
                 return
@@ -328,196 +645,28 @@ class ResponsiveApp(QMainWindow):
             self.progress_bar.setHidden(False)
             self.progress_bar.setValue(10)
             
-            # Make a copy of the dataframe to work with
-            df = self.clockify_data.copy()
+            # Parse durations and format dates once for all projects
+            normalized = self.normalize_data()
+            self.progress_bar.setValue(50)
             
-            # Required columns for the projects.xlsx format
-            required_columns = [
-                'Project', 'Description', 'User', 'Email', 
-                'Start Date', 'Start Time', 'End Date', 'End Time', 'Duration (h)'
-            ]
+            # Create a sheet for each project (preserve all entries including duplicates)
+            numeric = self.numeric_durations_checkbox.isChecked()
+            sheets = pipeline.build_project_sheets(normalized, numeric)
+            self.progress_bar.setValue(70)
             
-            # Create a writer to save multiple sheets
-            with pd.ExcelWriter(file_path, engine='openpyxl') as writer:
-                # Create a main sheet with all projects
-                main_df = pd.DataFrame(columns=required_columns)
-                
-                # Map existing columns to the target format
-                if 'Project' in df.columns:
-                    main_df['Project'] = df['Project']
-                else:
-                    main_df['Project'] = None
-                
-                if 'Description' in df.columns:
-                    main_df['Description'] = df['Description']
-                else:
-                    main_df['Description'] = None
-                
-                if 'User' in df.columns:
-                    main_df['User'] = df['User']
-                else:
-                    main_df['User'] = None
-                
-                if 'Email' in df.columns:
-                    main_df['Email'] = df['Email']
-                else:
-                    main_df['Email'] = None
-                
-                # Handle date and time columns
-                if 'Start Date' in df.columns:
-                    main_df['Start Date'] = df['Start Date']
-                    if pd.api.types.is_datetime64_any_dtype(df['Start Date']):
-                        main_df['Start Date'] = df['Start Date'].dt.strftime('%d/%m/%Y')
-                else:
-                    main_df['Start Date'] = None
-                
-                if 'Start Time' in df.columns:
-                    main_df['Start Time'] = df['Start Time']
-                else:
-                    main_df['Start Time'] = None
-                
-                if 'End Date' in df.columns:
-                    main_df['End Date'] = df['End Date']
-                    if pd.api.types.is_datetime64_any_dtype(df['End Date']):
-                        main_df['End Date'] = df['End Date'].dt.strftime('%d/%m/%Y')
-                else:
-                    main_df['End Date'] = None
-                
-                if 'End Time' in df.columns:
-                    main_df['End Time'] = df['End Time']
-                else:
-                    main_df['End Time'] = None
-                
-                # Handle duration
-                if 'Duration (h)' in df.columns:
-                    main_df['Duration (h)'] = df['Duration (h)']
-                elif 'Duration (decimal)' in df.columns:
-                    # Convert decimal hours to HH:MM:SS format
-                    def decimal_to_time(decimal_hours):
-                        if pd.isna(decimal_hours):
-                            return None
-                        hours = int(decimal_hours)
-                        minutes = int((decimal_hours - hours) * 60)
-                        seconds = int(((decimal_hours - hours) * 60 - minutes) * 60)
-                        return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-                    
-                    main_df['Duration (h)'] = df['Duration (decimal)'].apply(decimal_to_time)
-                else:
-                    # Try to extract duration from time entries if available
-                    main_df['Duration (h)'] = "00:00:00"
-                
-                self.progress_bar.setValue(30)
-                
-                # Calculate total duration for all entries
-                total_duration_seconds = 0
-                
-                # Process durations in HH:MM:SS format
-                for duration in main_df['Duration (h)']:
-                    if pd.notna(duration) and isinstance(duration, str):
-                        try:
-                            h, m, s = map(int, duration.split(':'))
-                            total_duration_seconds += h * 3600 + m * 60 + s
-                        except (ValueError, AttributeError):
-                            pass
-                    elif pd.notna(duration) and hasattr(duration, 'hour'):
-                        # Handle time objects
-                        total_duration_seconds += duration.hour * 3600 + duration.minute * 60 + duration.second
-                
-                # Convert total seconds to HH:MM:SS
-                total_hours = total_duration_seconds // 3600
-                remaining_seconds = total_duration_seconds % 3600
-                total_minutes = remaining_seconds // 60
-                total_seconds = remaining_seconds % 60
-                total_duration_str = f"{total_hours:02d}:{total_minutes:02d}:{total_seconds:02d}"
-                
-                # Add total row to main sheet
-                blank_row = pd.Series([None] * len(main_df.columns), index=main_df.columns)
-                main_df = pd.concat([main_df, pd.DataFrame([blank_row])], ignore_index=True)
-                
-                total_row = pd.Series([None] * len(main_df.columns), index=main_df.columns)
-                total_row['Project'] = 'Total:'
-                total_row['Duration (h)'] = total_duration_str
-                main_df = pd.concat([main_df, pd.DataFrame([total_row])], ignore_index=True)
-                
-                # Skip creating the 'All Projects' sheet as per user request
-                self.progress_bar.setValue(50)
-                
-                # Group by Project and create a sheet for each project
-                # Get unique project names while preserving order
-                unique_projects = []
-                for project in df['Project']:
-                    if project not in unique_projects and not pd.isna(project):
-                        unique_projects.append(project)
-                
-                project_count = len(unique_projects)
-                current_project = 0
-                
-                for project_name in unique_projects:
-                    current_project += 1
-                    progress = 50 + (current_project / project_count) * 40
-                    self.progress_bar.setValue(int(progress))
-                    
-                    # Filter data for this project without groupby to preserve duplicates
-                    project_data = df[df['Project'] == project_name].copy()
-                    
-                    # Create a dataframe for this project
-                    project_df = pd.DataFrame(columns=required_columns)
-                    
-                    # Fill in the data for this project (preserve all entries including duplicates)
-                    for col in required_columns:
-                        if col in project_data.columns:
-                            project_df[col] = project_data[col]
-                            
-                            # Format dates if needed
-                            if col in ['Start Date', 'End Date'] and pd.api.types.is_datetime64_any_dtype(project_data[col]):
-                                project_df[col] = project_data[col].dt.strftime('%d/%m/%Y')
-                        else:
-                            project_df[col] = None
-                    
-                    # Handle duration for this project
-                    if 'Duration (h)' in project_data.columns:
-                        project_df['Duration (h)'] = project_data['Duration (h)']
-                    elif 'Duration (decimal)' in project_data.columns:
-                        project_df['Duration (h)'] = project_data['Duration (decimal)'].apply(decimal_to_time)
-                    
-                    # Calculate total duration for this project
-                    project_duration_seconds = 0
-                    for duration in project_df['Duration (h)']:
-                        if pd.notna(duration) and isinstance(duration, str):
-                            try:
-                                h, m, s = map(int, duration.split(':'))
-                                project_duration_seconds += h * 3600 + m * 60 + s
-                            except (ValueError, AttributeError):
-                                pass
-                        elif pd.notna(duration) and hasattr(duration, 'hour'):
-                            project_duration_seconds += duration.hour * 3600 + duration.minute * 60 + duration.second
-                    
-                    # Convert project total seconds to HH:MM:SS
-                    project_hours = project_duration_seconds // 3600
-                    remaining = project_duration_seconds % 3600
-                    project_minutes = remaining // 60
-                    project_seconds = remaining % 60
-                    project_duration_str = f"{project_hours:02d}:{project_minutes:02d}:{project_seconds:02d}"
-                    
-                    # Add total row to project sheet
-                    blank_row = pd.Series([None] * len(project_df.columns), index=project_df.columns)
-                    project_df = pd.concat([project_df, pd.DataFrame([blank_row])], ignore_index=True)
-                    
-                    total_row = pd.Series([None] * len(project_df.columns), index=project_df.columns)
-                    total_row['Project'] = 'Total:'
-                    total_row['Duration (h)'] = project_duration_str
-                    project_df = pd.concat([project_df, pd.DataFrame([total_row])], ignore_index=True)
-                    
-                    # Save project sheet - use a valid sheet name (max 31 chars, no special chars)
-                    sheet_name = str(project_name)[:31].replace('/', '_').replace('\\', '_').replace('?', '_').replace('*', '_').replace('[', '_').replace(']', '_').replace(':', '_')
-                    project_df.to_excel(writer, sheet_name=sheet_name, index=False)
-                
-                self.progress_bar.setValue(95)
+            pipeline.write_outputs(
+                [(file_path, sheets, sharded)],
+                progress=lambda fraction: self.progress_bar.setValue(int(70 + fraction * 30)),
+                numeric=numeric
+            )
             
             self.progress_bar.setValue(100)
             self.status_bar.showMessage(f"Projects report saved to {file_path}")
             
-            QMessageBox.information(self, "Export Complete", f"Projects report exported to {file_path} with individual sheets for each project")
+            if sharded:
+                QMessageBox.information(self, "Export Complete", f"Projects report exported to {file_path} with a workbook for each project")
+            else:
+                QMessageBox.information(self, "Export Complete", f"Projects report exported to {file_path} with individual sheets for each project")
             
         except Exception as e:
             QMessageBox.critical(self, "Export Error", f"Failed to export projects report: {str(e)}")
@@ -527,18 +676,13 @@ class ResponsiveApp(QMainWindow):
     
     def export_hr(self):
         """Export HR-friendly timesheet to hr.xlsx with dedicated sheets for each person"""
-        if self.clockify_data is None:
-            QMessageBox.warning(self, "No Data", "Please import a Clockify report first.")
+        if not self.check_data_loaded():
             return
             
         try:
             # Get save file location
-            file_path, _ = QFileDialog.getSaveFileName(
-                self, 
-                "Save HR Report", 
-                "hr.xlsx", 
-                "Excel Files (*.xlsx)"
-            )
+            sharded = self.split_output_combo.currentIndex() >= 1
+            file_path = self.get_output_path("Save HR Report", "hr", sharded)
             
             if not file_path:
                 return
@@ -547,321 +691,209 @@ class ResponsiveApp(QMainWindow):
             self.progress_bar.setHidden(False)
             self.progress_bar.setValue(10)
             
-            # Make a copy of the dataframe to work with
-            df = self.clockify_data.copy()
+            # Parse durations once, then sum them per user, project and description
+            normalized = self.normalize_data()
+            self.progress_bar.setValue(40)
             
-            # Required columns for HR format
-            required_columns = ['Project', 'Description', 'Time (h)']
+            numeric = self.numeric_durations_checkbox.isChecked()
+            sheets = pipeline.build_hr_sheets(normalized, pipeline.report_date_range(self.clockify_data), numeric)
+            self.progress_bar.setValue(70)
             
-            # Create a writer to save multiple sheets
-            with pd.ExcelWriter(file_path, engine='openpyxl') as writer:
-                # Create a main sheet with all entries
-                all_rows = []
-                grand_total_seconds = 0
-                
-                # Group by Project to get the main entries
-                project_groups = df.groupby('Project')
-                
-                for project_name, project_data in project_groups:
-                    if pd.isna(project_name):
-                        continue
-                        
-                    # Calculate total time for this project
-                    project_seconds = 0
-                    
-                    # Try to get duration from different possible columns
-                    if 'Duration (decimal)' in project_data.columns:
-                        # Convert decimal hours to seconds
-                        for hours in project_data['Duration (decimal)']:
-                            if pd.notna(hours):
-                                project_seconds += int(hours * 3600)
-                    elif 'Duration (h)' in project_data.columns:
-                        # Parse HH:MM:SS format
-                        for duration in project_data['Duration (h)']:
-                            if pd.notna(duration) and isinstance(duration, str):
-                                try:
-                                    h, m, s = map(int, duration.split(':'))
-                                    project_seconds += h * 3600 + m * 60 + s
-                                except (ValueError, AttributeError):
-                                    pass
-                            elif pd.notna(duration) and hasattr(duration, 'hour'):
-                                # Handle time objects
-                                project_seconds += duration.hour * 3600 + duration.minute * 60 + duration.second
-                    
-                    # Convert project seconds to HH:MM:SS
-                    project_hours = project_seconds // 3600
-                    remaining = project_seconds % 3600
-                    project_minutes = remaining // 60
-                    project_seconds_remainder = remaining % 60
-                    project_time_str = f"{project_hours:02d}:{project_minutes:02d}:{project_seconds_remainder:02d}"
-                    
-                    # Add to grand total
-                    grand_total_seconds += project_seconds
-                    
-                    # Add the main project row
-                    project_row = {
-                        'Project': project_name,
-                        'Description': None,
-                        'Time (h)': project_time_str
-                    }
-                    all_rows.append(project_row)
-                    
-                    # Group entries by description and sum their durations
-                    desc_groups = {}
-                    
-                    for idx, row in project_data.iterrows():
-                        desc = row.get('Description')
-                        if pd.notna(desc):  # Only process if description is not NA
-                            # Get duration for this individual entry
-                            entry_seconds = 0
-                            
-                            if 'Duration (decimal)' in project_data.columns and pd.notna(row.get('Duration (decimal)')):
-                                entry_seconds = int(row.get('Duration (decimal)') * 3600)
-                            elif 'Duration (h)' in project_data.columns and pd.notna(row.get('Duration (h)')):
-                                duration = row.get('Duration (h)')
-                                if isinstance(duration, str):
-                                    try:
-                                        h, m, s = map(int, duration.split(':'))
-                                        entry_seconds = h * 3600 + m * 60 + s
-                                    except (ValueError, AttributeError):
-                                        pass
-                                elif hasattr(duration, 'hour'):
-                                    entry_seconds = duration.hour * 3600 + duration.minute * 60 + duration.second
-                            
-                            # Add to the description group total
-                            if desc in desc_groups:
-                                desc_groups[desc] += entry_seconds
-                            else:
-                                desc_groups[desc] = entry_seconds
-                    
-                    # Create a row for each unique description with summed duration
-                    for desc, total_seconds in desc_groups.items():
-                        # Convert total seconds to HH:MM:SS
-                        total_hours = total_seconds // 3600
-                        remaining = total_seconds % 3600
-                        total_minutes = remaining // 60
-                        total_seconds_remainder = remaining % 60
-                        total_time_str = f"{total_hours:02d}:{total_minutes:02d}:{total_seconds_remainder:02d}"
-                        
-                        desc_row = {
-                            'Project': None,
-                            'Description': desc,
-                            'Time (h)': total_time_str
-                        }
-                        all_rows.append(desc_row)
-                
-                # Create the DataFrame from all rows
-                hr_df = pd.DataFrame(all_rows)
-                
-                self.progress_bar.setValue(40)
-                
-                # Get date range for the total row
-                start_date = None
-                end_date = None
-                if 'Start Date' in df.columns and not df['Start Date'].empty:
-                    if pd.api.types.is_datetime64_any_dtype(df['Start Date']):
-                        start_date = df['Start Date'].min().strftime('%d/%m/%Y')
-                    else:
-                        # Try to parse the date strings
-                        try:
-                            dates = pd.to_datetime(df['Start Date'])
-                            start_date = dates.min().strftime('%d/%m/%Y')
-                        except:
-                            pass
-                
-                if 'End Date' in df.columns and not df['End Date'].empty:
-                    if pd.api.types.is_datetime64_any_dtype(df['End Date']):
-                        end_date = df['End Date'].max().strftime('%d/%m/%Y')
-                    else:
-                        # Try to parse the date strings
-                        try:
-                            dates = pd.to_datetime(df['End Date'])
-                            end_date = dates.max().strftime('%d/%m/%Y')
-                        except:
-                            pass
-                
-                # Convert grand total seconds to HH:MM:SS
-                grand_total_hours = grand_total_seconds // 3600
-                remaining = grand_total_seconds % 3600
-                grand_total_minutes = remaining // 60
-                grand_total_seconds_remainder = remaining % 60
-                grand_total_str = f"{grand_total_hours:02d}:{grand_total_minutes:02d}:{grand_total_seconds_remainder:02d}"
-                
-                # Add total row with date range if available
-                date_range = ""
-                if start_date and end_date:
-                    date_range = f"Total ({start_date} - {end_date})"
-                else:
-                    date_range = "Total"
+            pipeline.write_outputs(
+                [(file_path, sheets, sharded)],
+                progress=lambda fraction: self.progress_bar.setValue(int(70 + fraction * 30)),
+                numeric=numeric
+            )
+            
+            self.progress_bar.setValue(100)
+            self.status_bar.showMessage(f"HR report saved to {file_path}")
+            
+            if sharded:
+                QMessageBox.information(self, "Export Complete", f"HR report exported to {file_path} with a workbook for each person")
+            else:
+                QMessageBox.information(self, "Export Complete", f"HR report exported to {file_path} with individual sheets for each person")
+            
+        except Exception as e:
+            QMessageBox.critical(self, "Export Error", f"Failed to export HR report: {str(e)}")
+            self.status_bar.showMessage("Export failed")
+        finally:
+            self.progress_bar.setHidden(True)
+    
+    def export_all(self):
+        """Export both projects.xlsx and hr.xlsx to a folder in a single pass"""
+        if not self.check_data_loaded():
+            return
+            
+        try:
+            # Get the output folder
+            output_dir = QFileDialog.getExistingDirectory(self, "Select Output Folder")
+            
+            if not output_dir:
+                return
                 
-                # Add blank row before total
-                blank_row = pd.Series([None] * len(required_columns), index=required_columns)
-                hr_df = pd.concat([hr_df, pd.DataFrame([blank_row])], ignore_index=True)
+            shard_hr = self.split_output_combo.currentIndex() >= 1
+            shard_projects = self.split_output_combo.currentIndex() == 2
+            as_zip = self.zip_shards_checkbox.isChecked()
+            projects_path = pipeline.output_path(output_dir, "projects", shard_projects, as_zip)
+            hr_path = pipeline.output_path(output_dir, "hr", shard_hr, as_zip)
+            
+            self.status_bar.showMessage("Processing projects and HR data...")
+            self.progress_bar.setHidden(False)
+            self.progress_bar.setValue(0)
+            
+            # Normalize and aggregate once, then write both workbooks concurrently
+            pipeline.export_all(
+                self.clockify_data, projects_path, hr_path,
+                progress=lambda value: self.progress_bar.setValue(int(value)),
+                numeric=self.numeric_durations_checkbox.isChecked(),
+                shard_projects=shard_projects,
+                shard_hr=shard_hr,
+                rules=self.rounding_rules(),
+                grouping=self.description_grouping()
+            )
+            
+            self.progress_bar.setValue(100)
+            self.status_bar.showMessage(f"Projects and HR reports saved to {output_dir}")
+            
+            QMessageBox.information(self, "Export Complete", f"Projects and HR reports exported to {output_dir}")
+            
+        except Exception as e:
+            QMessageBox.critical(self, "Export Error", f"Failed to export reports: {str(e)}")
+            self.status_bar.showMessage("Export failed")
+        finally:
+            self.progress_bar.setHidden(True)
+
+    def export_data(self):
+        """Export project entries and description totals as machine-readable tables"""
+        if not self.check_data_loaded():
+            return
+            
+        try:
+            # Get the output folder
+            output_dir = QFileDialog.getExistingDirectory(self, "Select Output Folder")
+            
+            if not output_dir:
+                return
                 
-                # Add total row
-                total_row = pd.Series([None] * len(required_columns), index=required_columns)
-                total_row['Project'] = date_range
-                total_row['Time (h)'] = f"Total:\n{grand_total_str}"
-                hr_df = pd.concat([hr_df, pd.DataFrame([total_row])], ignore_index=True)
+            self.status_bar.showMessage("Processing data tables...")
+            self.progress_bar.setHidden(False)
+            self.progress_bar.setValue(10)
+            
+            # Combo box entries follow pipeline.TABLE_FORMATS
+            fmt = pipeline.TABLE_FORMATS[self.data_format_combo.currentIndex()]
+            paths = pipeline.export_tables(self.clockify_data, output_dir, fmt, normalized=self.normalize_data())
+            
+            self.progress_bar.setValue(100)
+            self.status_bar.showMessage(f"Data tables saved to {output_dir}")
+            
+            file_names = ", ".join(os.path.basename(path) for path in paths)
+            QMessageBox.information(self, "Export Complete", f"Exported {file_names} to {output_dir}")
+            
+        except Exception as e:
+            QMessageBox.critical(self, "Export Error", f"Failed to export data tables: {str(e)}")
+            self.status_bar.showMessage("Export failed")
+        finally:
+            self.progress_bar.setHidden(True)
+
+    def audit_entries(self):
+        """Report duplicate and overlapping time entries of each person"""
+        if not self.check_data_loaded():
+            return
+            
+        try:
+            # Get save file location
+            file_path, _ = QFileDialog.getSaveFileName(
+                self, 
+                "Save Audit Report", 
+                "audit.xlsx", 
+                "Excel Files (*.xlsx);;CSV Files (*.csv)"
+            )
+            
+            if not file_path:
+                return
                 
-                # Skip creating the 'All Entries' sheet as per user request
-                self.progress_bar.setValue(50)
+            self.status_bar.showMessage("Checking for duplicate and overlapping entries...")
+            self.progress_bar.setHidden(False)
+            self.progress_bar.setValue(10)
+            
+            normalized = pipeline.normalize_report(self.clockify_data)
+            self.progress_bar.setValue(40)
+            
+            findings = audit.audit_entries(normalized)
+            self.progress_bar.setValue(70)
+            
+            audit.write_audit(findings, file_path)
+            
+            self.progress_bar.setValue(100)
+            summary = audit.audit_summary(findings)
+            self.status_bar.showMessage(f"{summary}, audit report saved to {file_path}")
+            
+            QMessageBox.information(self, "Audit Complete", f"{summary}.\nAudit report exported to {file_path}")
+            
+        except Exception as e:
+            QMessageBox.critical(self, "Audit Error", f"Failed to audit entries: {str(e)}")
+            self.status_bar.showMessage("Audit failed")
+        finally:
+            self.progress_bar.setHidden(True)
+
+    def compare_reports(self):
+        """Compare the imported report with a previous one, per description, project and person"""
+        if not self.check_data_loaded():
+            return
+            
+        try:
+            previous_path, _ = QFileDialog.getOpenFileName(
+                self, 
+                "Select Previous Clockify Report", 
+                "", 
+                "Excel Files (*.xlsx *.xls)"
+            )
+            
+            if not previous_path:
+                return
                 
-                # Create sheets for each person
-                if 'User' in df.columns:
-                    user_groups = df.groupby('User')
-                    user_count = len(user_groups)
-                    current_user = 0
-                    
-                    for user_name, user_data in user_groups:
-                        if pd.isna(user_name):
-                            continue
-                        
-                        current_user += 1
-                        progress = 50 + (current_user / user_count) * 40
-                        self.progress_bar.setValue(int(progress))
-                        
-                        # Create a dataframe for this user
-                        user_rows = []
-                        user_total_seconds = 0
-                        
-                        # Group by Project for this user
-                        user_project_groups = user_data.groupby('Project')
-                        
-                        for project_name, project_data in user_project_groups:
-                            if pd.isna(project_name):
-                                continue
-                            
-                            # Calculate total time for this project
-                            project_seconds = 0
-                            
-                            # Try to get duration from different possible columns
-                            if 'Duration (decimal)' in project_data.columns:
-                                for hours in project_data['Duration (decimal)']:
-                                    if pd.notna(hours):
-                                        project_seconds += int(hours * 3600)
-                            elif 'Duration (h)' in project_data.columns:
-                                for duration in project_data['Duration (h)']:
-                                    if pd.notna(duration) and isinstance(duration, str):
-                                        try:
-                                            h, m, s = map(int, duration.split(':'))
-                                            project_seconds += h * 3600 + m * 60 + s
-                                        except (ValueError, AttributeError):
-                                            pass
-                                    elif pd.notna(duration) and hasattr(duration, 'hour'):
-                                        project_seconds += duration.hour * 3600 + duration.minute * 60 + duration.second
-                            
-                            # Convert project seconds to HH:MM:SS
-                            project_hours = project_seconds // 3600
-                            remaining = project_seconds % 3600
-                            project_minutes = remaining // 60
-                            project_seconds_remainder = remaining % 60
-                            project_time_str = f"{project_hours:02d}:{project_minutes:02d}:{project_seconds_remainder:02d}"
-                            
-                            # Add to user total
-                            user_total_seconds += project_seconds
-                            
-                            # Add the main project row
-                            project_row = {
-                                'Project': project_name,
-                                'Description': None,
-                                'Time (h)': project_time_str
-                            }
-                            user_rows.append(project_row)
-                            
-                            # Group entries by description and sum their durations
-                            desc_groups = {}
-                            
-                            for idx, row in project_data.iterrows():
-                                desc = row.get('Description')
-                                if pd.notna(desc):  # Only process if description is not NA
-                                    # Get duration for this individual entry
-                                    entry_seconds = 0
-                                    
-                                    if 'Duration (decimal)' in project_data.columns and pd.notna(row.get('Duration (decimal)')):
-                                        entry_seconds = int(row.get('Duration (decimal)') * 3600)
-                                    elif 'Duration (h)' in project_data.columns and pd.notna(row.get('Duration (h)')):
-                                        duration = row.get('Duration (h)')
-                                        if isinstance(duration, str):
-                                            try:
-                                                h, m, s = map(int, duration.split(':'))
-                                                entry_seconds = h * 3600 + m * 60 + s
-                                            except (ValueError, AttributeError):
-                                                pass
-                                        elif hasattr(duration, 'hour'):
-                                            entry_seconds = duration.hour * 3600 + duration.minute * 60 + duration.second
-                                    
-                                    # Add to the description group total
-                                    if desc in desc_groups:
-                                        desc_groups[desc] += entry_seconds
-                                    else:
-                                        desc_groups[desc] = entry_seconds
-                            
-                            # Create a row for each unique description with summed duration
-                            for desc, total_seconds in desc_groups.items():
-                                # Convert total seconds to HH:MM:SS
-                                total_hours = total_seconds // 3600
-                                remaining = total_seconds % 3600
-                                total_minutes = remaining // 60
-                                total_seconds_remainder = remaining % 60
-                                total_time_str = f"{total_hours:02d}:{total_minutes:02d}:{total_seconds_remainder:02d}"
-                                
-                                desc_row = {
-                                    'Project': None,
-                                    'Description': desc,
-                                    'Time (h)': total_time_str
-                                }
-                                user_rows.append(desc_row)
-                        
-                        # Create the DataFrame for this user
-                        user_df = pd.DataFrame(user_rows)
-                        
-                        # Convert user total seconds to HH:MM:SS
-                        user_total_hours = user_total_seconds // 3600
-                        remaining = user_total_seconds % 3600
-                        user_total_minutes = remaining // 60
-                        user_total_seconds_remainder = remaining % 60
-                        user_total_str = f"{user_total_hours:02d}:{user_total_minutes:02d}:{user_total_seconds_remainder:02d}"
-                        
-                        # Add blank row before total
-                        if not user_df.empty:
-                            blank_row = pd.Series([None] * len(required_columns), index=required_columns)
-                            user_df = pd.concat([user_df, pd.DataFrame([blank_row])], ignore_index=True)
-                            
-                            # Add total row with date range if available
-                            date_range = ""
-                            if start_date and end_date:
-                                date_range = f"Total ({start_date} - {end_date})"
-                            else:
-                                date_range = "Total"
-                            
-                            total_row = pd.Series([None] * len(required_columns), index=required_columns)
-                            total_row['Project'] = date_range
-                            total_row['Time (h)'] = f"Total:\n{user_total_str}"
-                            user_df = pd.concat([user_df, pd.DataFrame([total_row])], ignore_index=True)
-                            
-                            # Save user sheet - use a valid sheet name (max 31 chars, no special chars)
-                            sheet_name = str(user_name)[:31].replace('/', '_').replace('\\', '_').replace('?', '_').replace('*', '_').replace('[', '_').replace(']', '_').replace(':', '_')
-                            user_df.to_excel(writer, sheet_name=sheet_name, index=False)
+            # Get save file location
+            file_path, _ = QFileDialog.getSaveFileName(
+                self, 
+                "Save Comparison Report", 
+                "comparison.xlsx", 
+                "Excel Files (*.xlsx)"
+            )
+            
+            if not file_path:
+                return
                 
-                self.progress_bar.setValue(95)
+            self.status_bar.showMessage(f"Loading file: {os.path.basename(previous_path)}")
+            self.progress_bar.setHidden(False)
+            self.progress_bar.setValue(10)
             
-            self.progress_bar.setValue(100)
-            self.status_bar.showMessage(f"HR report saved to {file_path}")
+            previous_data = readers.read_report(previous_path).frame
+            self.progress_bar.setValue(40)
             
-            QMessageBox.information(self, "Export Complete", f"HR report exported to {file_path} with individual sheets for each person")
+            self.status_bar.showMessage("Comparing reports...")
+            descriptions, projects, users = compare.compare_reports(previous_data, self.clockify_data)
+            self.progress_bar.setValue(70)
+            
+            compare.write_comparison(file_path, descriptions, projects, users)
             
             self.progress_bar.setValue(100)
-            self.status_bar.showMessage(f"HR report saved to {file_path}")
+            summary = compare.comparison_summary(descriptions)
+            self.status_bar.showMessage(f"{summary}, comparison saved to {file_path}")
             
-            QMessageBox.information(self, "Export Complete", f"HR report exported to {file_path}")
+            QMessageBox.information(self, "Comparison Complete", f"{summary}.\nComparison report exported to {file_path}")
             
         except Exception as e:
-            QMessageBox.critical(self, "Export Error", f"Failed to export HR report: {str(e)}")
-            self.status_bar.showMessage("Export failed")
+            QMessageBox.critical(self, "Comparison Error", f"Failed to compare reports: {str(e)}")
+            self.status_bar.showMessage("Comparison failed")
         finally:
             self.progress_bar.setHidden(True)
 
+    def closeEvent(self, event):
+        """Wait for background loads, which can't be interrupted, before closing"""
+        for loader in self.findChildren(ReportLoader):
+            loader.wait()
+        super().closeEvent(event)
+
 def signal_handler(sig, frame):
     """Handle Ctrl+C signal"""
     print("\nExiting application gracefully...")
@@ -869,6 +901,14 @@ def signal_handler(sig, frame):
     sys.exit(0)
 
 def main():
+    # Needed for the export worker processes in frozen builds
+    multiprocessing.freeze_support()
+    
+    # Run headless when command line arguments are given
+    if len(sys.argv) > 1:
+        import cli
+        sys.exit(cli.main(sys.argv[1:]))
+    
     # Set up signal handler for clean termination
     signal.signal(signal.SIGINT, signal_handler)
     
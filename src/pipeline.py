@@ -0,0 +1,686 @@
+import io
+import os
+import re
+import zipfile
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+import pandas as pd
+from openpyxl.styles import Font, NamedStyle, PatternFill
+
+import description_groups
+import rounding
+
+# Columns of the detailed projects.xlsx sheets
+PROJECT_COLUMNS = [
+    'Project', 'Description', 'User', 'Email',
+    'Start Date', 'Start Time', 'End Date', 'End Time', 'Duration (h)'
+]
+
+# Columns of the hr.xlsx timesheet sheets
+HR_COLUMNS = ['Project', 'Description', 'Time (h)']
+
+# Column added after the raw durations when billing rounding rules are applied
+ROUNDED_COLUMN = 'Rounded (h)'
+
+# Columns holding durations, formatted as [h]:mm:ss in numeric workbooks
+DURATION_COLUMNS = ['Duration (h)', 'Time (h)', ROUNDED_COLUMN]
+
+# Name of the file listing the totals of each workbook in a sharded output
+SHARD_MANIFEST = 'manifest.csv'
+
+# Longest shard file name (without extension), well within file system limits
+MAX_SHARD_NAME = 200
+
+# Machine-readable table formats (see export_tables)
+TABLE_FORMATS = ['csv', 'jsonl', 'parquet']
+
+# Excel number format for numeric durations (hours keep counting past 24)
+DURATION_FORMAT = '[h]:mm:ss'
+
+# A single worksheet ready to be written: sanitized name, frame, its total in seconds,
+# the positions of subtotal rows (the total row is always the last one), the
+# user or project it was built for and its rounded total (None without rounding rules)
+Sheet = namedtuple('Sheet', ['name', 'frame', 'total_seconds', 'subtotal_rows', 'label', 'rounded_seconds'],
+                   defaults=[(), None, None])
+
+
+def sanitize_sheet_name(name):
+    """Return a valid Excel sheet name (max 31 chars, no special chars)"""
+    return str(name)[:31].replace('/', '_').replace('\\', '_').replace('?', '_').replace('*', '_').replace('[', '_').replace(']', '_').replace(':', '_')
+
+
+def format_seconds(total_seconds):
+    """Convert a number of seconds to HH:MM:SS"""
+    hours = total_seconds // 3600
+    remaining = total_seconds % 3600
+    minutes = remaining // 60
+    seconds = remaining % 60
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+
+
+def format_seconds_column(seconds):
+    """Convert an array of seconds to HH:MM:SS strings, formatting each distinct value once"""
+    return _map_unique(pd.Series(seconds), lambda value: format_seconds(int(value)))
+
+
+def excel_duration(seconds):
+    """Convert seconds to an Excel time value (fraction of a day)"""
+    return seconds / 86400
+
+
+def decimal_to_time(decimal_hours):
+    """Convert decimal hours to HH:MM:SS format"""
+    if pd.isna(decimal_hours):
+        return None
+    hours = int(decimal_hours)
+    minutes = int((decimal_hours - hours) * 60)
+    seconds = int(((decimal_hours - hours) * 60 - minutes) * 60)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+
+
+def parse_duration(duration):
+    """Convert an HH:MM:SS string or time object to seconds (None if it can't be parsed)"""
+    if pd.notna(duration) and isinstance(duration, str):
+        try:
+            h, m, s = map(int, duration.split(':'))
+            return h * 3600 + m * 60 + s
+        except (ValueError, AttributeError):
+            return None
+    elif pd.notna(duration) and hasattr(duration, 'hour'):
+        # Handle time objects
+        return duration.hour * 3600 + duration.minute * 60 + duration.second
+    return None
+
+
+def duration_to_seconds(duration):
+    """Convert an HH:MM:SS string or time object to seconds (0 if it can't be parsed)"""
+    seconds = parse_duration(duration)
+    return 0 if seconds is None else seconds
+
+
+def _map_unique(series, func, dtype=object, missing=None):
+    """Apply func once per distinct value of series and broadcast the results back"""
+    codes, uniques = pd.factorize(series)
+    values = np.array([func(value) for value in uniques] + [missing], dtype=dtype)
+    # Missing values have code -1, which picks the trailing `missing` slot
+    return values[codes]
+
+
+def _format_dates(dates):
+    """Format a datetime column as dd/mm/yyyy once per distinct date"""
+    codes, uniques = pd.factorize(dates)
+    values = np.append(np.asarray(uniques.strftime('%d/%m/%Y'), dtype=object), np.nan)
+    return pd.Series(values[codes], index=dates.index)
+
+
+def _decimal_seconds(hours):
+    """Truncate decimal hours to whole seconds, treating missing values as 0"""
+    seconds = np.trunc(hours.astype(float).to_numpy() * 3600)
+    return np.nan_to_num(seconds).astype(np.int64)
+
+
+def time_of_day_seconds(value):
+    """Convert a time of day (time object or text such as 09:00:00 / 9:00 AM) to seconds"""
+    if pd.isna(value):
+        return np.nan
+    if not isinstance(value, str) and hasattr(value, 'hour'):
+        return value.hour * 3600 + value.minute * 60 + value.second
+    try:
+        parsed = pd.Timestamp(str(value))
+    except (ValueError, TypeError):
+        return np.nan
+    return parsed.hour * 3600 + parsed.minute * 60 + parsed.second
+
+
+def _parse_dates(series):
+    """Parse a date column (datetimes or dd/mm/yyyy text) once per distinct value"""
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return series.dt.normalize()
+    codes, uniques = pd.factorize(series)
+    parsed = pd.to_datetime(pd.Series(uniques, dtype=object), dayfirst=True, errors='coerce').dt.normalize()
+    values = np.append(parsed.to_numpy(dtype='datetime64[ns]'), np.datetime64('NaT', 'ns'))
+    return pd.Series(values[codes], index=series.index)
+
+
+def parse_timestamps(df, date_column, time_column):
+    """Combine a date column and a time column into timestamps (NaT if the date is missing)"""
+    if date_column not in df.columns:
+        return pd.Series(pd.NaT, index=df.index, dtype='datetime64[ns]')
+    dates = _parse_dates(df[date_column])
+    if time_column not in df.columns:
+        return dates
+    seconds = _map_unique(df[time_column], time_of_day_seconds, dtype=float, missing=np.nan)
+    return dates + np.nan_to_num(seconds).astype(np.int64).astype('timedelta64[s]')
+
+
+def report_date_range(df):
+    """Return the label of the total rows, including the report's date range if available"""
+    start_date = None
+    end_date = None
+    if 'Start Date' in df.columns and not df['Start Date'].empty:
+        if pd.api.types.is_datetime64_any_dtype(df['Start Date']):
+            start_date = df['Start Date'].min().strftime('%d/%m/%Y')
+        else:
+            # Try to parse the date strings
+            try:
+                dates = pd.to_datetime(df['Start Date'])
+                start_date = dates.min().strftime('%d/%m/%Y')
+            except Exception:
+                pass
+
+    if 'End Date' in df.columns and not df['End Date'].empty:
+        if pd.api.types.is_datetime64_any_dtype(df['End Date']):
+            end_date = df['End Date'].max().strftime('%d/%m/%Y')
+        else:
+            # Try to parse the date strings
+            try:
+                dates = pd.to_datetime(df['End Date'])
+                end_date = dates.max().strftime('%d/%m/%Y')
+            except Exception:
+                pass
+
+    if start_date and end_date:
+        return f"Total ({start_date} - {end_date})"
+    return "Total"
+
+
+def normalize_report(df):
+    """Normalize a raw Clockify report once so both exports can share it
+
+    The result holds the projects.xlsx columns (dates formatted, durations as
+    displayed) plus:
+      - duration_seconds: the displayed 'Duration (h)' value, used by projects.xlsx
+      - seconds: per entry duration used for HR description totals
+      - rollup_seconds: per entry duration used for HR project totals
+      - start, end: entry start and end timestamps
+    rounding.apply_rounding adds rounded copies of the second columns and
+    description_groups.apply_grouping adds the description_group column.
+    """
+    # Both exports group by project, so a report without one can't be processed
+    if 'Project' not in df.columns:
+        raise KeyError('Project')
+
+    normalized = pd.DataFrame(index=df.index)
+
+    for col in PROJECT_COLUMNS:
+        if col in df.columns:
+            normalized[col] = df[col]
+            # Format dates if needed
+            if col in ['Start Date', 'End Date'] and pd.api.types.is_datetime64_any_dtype(df[col]):
+                normalized[col] = _format_dates(df[col])
+        else:
+            normalized[col] = None
+
+    # Displayed duration, converted from decimal hours if needed
+    if 'Duration (h)' not in df.columns and 'Duration (decimal)' in df.columns:
+        normalized['Duration (h)'] = _map_unique(df['Duration (decimal)'], decimal_to_time)
+
+    normalized['duration_seconds'] = _map_unique(
+        normalized['Duration (h)'], duration_to_seconds, dtype=np.int64, missing=0
+    )
+
+    # HR durations prefer decimal hours and fall back to HH:MM:SS per entry
+    if 'Duration (h)' in df.columns:
+        parsed_seconds = _map_unique(df['Duration (h)'], duration_to_seconds, dtype=np.int64, missing=0)
+    else:
+        parsed_seconds = np.zeros(len(df), dtype=np.int64)
+
+    if 'Duration (decimal)' in df.columns:
+        decimal_seconds = _decimal_seconds(df['Duration (decimal)'])
+        normalized['seconds'] = np.where(df['Duration (decimal)'].notna(), decimal_seconds, parsed_seconds)
+        normalized['rollup_seconds'] = decimal_seconds
+    else:
+        normalized['seconds'] = parsed_seconds
+        normalized['rollup_seconds'] = parsed_seconds
+
+    normalized['seconds'] = normalized['seconds'].astype(np.int64)
+    normalized['rollup_seconds'] = normalized['rollup_seconds'].astype(np.int64)
+
+    normalized['start'] = parse_timestamps(df, 'Start Date', 'Start Time')
+    normalized['end'] = parse_timestamps(df, 'End Date', 'End Time')
+    return normalized
+
+
+def _append_total(frame, columns, label_column, label, totals):
+    """Append the blank row and the total row (totals maps columns to values) to a sheet"""
+    blank_row = pd.Series([None] * len(columns), index=columns)
+    frame = pd.concat([frame, pd.DataFrame([blank_row])], ignore_index=True)
+
+    total_row = pd.Series([None] * len(columns), index=columns)
+    total_row[label_column] = label
+    for column, total in totals.items():
+        total_row[column] = total
+    return pd.concat([frame, pd.DataFrame([total_row])], ignore_index=True)
+
+
+def build_project_sheets(normalized, numeric=False):
+    """Build one sheet per project, in order of first appearance, keeping duplicate entries
+
+    With numeric=True durations and totals are Excel time values instead of HH:MM:SS strings.
+    If rounding rules were applied, a Rounded (h) column follows the raw durations.
+    """
+    codes, projects = pd.factorize(normalized['Project'])
+    if not len(projects):
+        return []
+    rounded = 'rounded_duration_seconds' in normalized.columns
+    columns = PROJECT_COLUMNS + [ROUNDED_COLUMN] if rounded else PROJECT_COLUMNS
+
+    # Stable sort keeps each project's entries in their original order
+    order = np.argsort(codes, kind='stable')
+    counts = np.bincount(codes[codes >= 0], minlength=len(projects))
+    starts = np.concatenate([[0], np.cumsum(counts)]) + np.count_nonzero(codes < 0)
+
+    def project_totals(column):
+        return np.bincount(
+            codes[codes >= 0],
+            weights=normalized[column].to_numpy()[codes >= 0],
+            minlength=len(projects)
+        ).astype(np.int64)
+
+    totals = project_totals('duration_seconds')
+    rounded_totals = project_totals('rounded_duration_seconds') if rounded else None
+
+    details = normalized[PROJECT_COLUMNS]
+    # Durations that can't be parsed are kept as they are instead of showing up as 0:00:00
+    parsed = pd.Series(_map_unique(
+        normalized['Duration (h)'], lambda value: parse_duration(value) is not None, dtype=bool, missing=False
+    ), index=normalized.index)
+    if numeric:
+        durations = excel_duration(normalized['duration_seconds'].where(parsed)).astype(object)
+        details = details.assign(**{'Duration (h)': durations.where(parsed, normalized['Duration (h)'])})
+    if rounded:
+        rounded_seconds = normalized['rounded_duration_seconds'].where(parsed)
+        if numeric:
+            details = details.assign(**{ROUNDED_COLUMN: excel_duration(rounded_seconds)})
+        else:
+            details = details.assign(**{ROUNDED_COLUMN: _map_unique(
+                rounded_seconds, lambda value: format_seconds(int(value))
+            )})
+
+    format_time = excel_duration if numeric else format_seconds
+    sheets = []
+    for i, project_name in enumerate(projects):
+        project_df = details.iloc[order[starts[i]:starts[i + 1]]]
+        total_seconds = int(totals[i])
+        totals_row = {'Duration (h)': format_time(total_seconds)}
+        rounded_seconds = None
+        if rounded:
+            rounded_seconds = int(rounded_totals[i])
+            totals_row[ROUNDED_COLUMN] = format_time(rounded_seconds)
+        project_df = _append_total(project_df, columns, 'Project', 'Total:', totals_row)
+        sheets.append(Sheet(sanitize_sheet_name(project_name), project_df, total_seconds,
+                            label=project_name, rounded_seconds=rounded_seconds))
+    return sheets
+
+
+def build_hr_sheets(normalized, date_range, numeric=False):
+    """Build one timesheet per user with project totals and summed descriptions
+
+    With numeric=True durations and totals are Excel time values instead of HH:MM:SS strings.
+    If rounding rules were applied, a Rounded (h) column follows the raw times.
+    If descriptions were grouped, the groups are summed instead of the exact descriptions.
+    """
+    format_time = excel_duration if numeric else format_seconds
+    if normalized['User'].isna().all():
+        return []
+    rounded = 'rounded_seconds' in normalized.columns
+    columns = HR_COLUMNS + [ROUNDED_COLUMN] if rounded else HR_COLUMNS
+
+    # Raw and rounded sums are aggregated together, then written to these columns
+    time_columns = ['Time (h)', ROUNDED_COLUMN] if rounded else ['Time (h)']
+    project_columns = ['rollup_seconds', 'rounded_rollup_seconds'] if rounded else ['rollup_seconds']
+    desc_columns = ['seconds', 'rounded_seconds'] if rounded else ['seconds']
+
+    # Project totals per user, sorted by user then project
+    project_totals = normalized.groupby(['User', 'Project'])[project_columns].sum()
+
+    # Description totals in order of first appearance within each (user, project).
+    # Description groups are categorical, so they are grouped on their integer codes.
+    desc_column = 'description_group' if 'description_group' in normalized.columns else 'Description'
+    described = normalized[normalized[desc_column].notna()]
+    desc_totals = described.groupby(
+        ['User', 'Project', desc_column], sort=False, observed=True
+    )[desc_columns].sum()
+    descriptions = {}
+    for (user_name, project_name, desc), total_seconds in zip(desc_totals.index, desc_totals.to_numpy()):
+        descriptions.setdefault((user_name, project_name), []).append((desc, total_seconds))
+
+    def times(seconds):
+        return {column: format_time(int(value)) for column, value in zip(time_columns, seconds)}
+
+    user_rows = {}
+    user_totals = {}
+    for (user_name, project_name), project_seconds in zip(project_totals.index, project_totals.to_numpy()):
+        rows = user_rows.setdefault(user_name, [])
+        user_totals[user_name] = user_totals.get(user_name, 0) + project_seconds
+        rows.append({'Project': project_name, 'Description': None, **times(project_seconds)})
+        for desc, total_seconds in descriptions.get((user_name, project_name), []):
+            rows.append({'Project': None, 'Description': desc, **times(total_seconds)})
+
+    sheets = []
+    for user_name, rows in user_rows.items():
+        seconds = [int(value) for value in user_totals[user_name]]
+        if numeric:
+            totals_row = {column: excel_duration(value) for column, value in zip(time_columns, seconds)}
+        else:
+            totals_row = {column: f"Total:\n{format_seconds(value)}" for column, value in zip(time_columns, seconds)}
+        user_df = _append_total(pd.DataFrame(rows, columns=columns), columns, 'Project', date_range, totals_row)
+        subtotal_rows = tuple(i for i, row in enumerate(rows) if row['Description'] is None)
+        sheets.append(Sheet(sanitize_sheet_name(user_name), user_df, seconds[0], subtotal_rows, user_name,
+                            seconds[1] if rounded else None))
+    return sheets
+
+
+def _text_column(series):
+    """Return a column as nullable text so every output format gets a single type"""
+    return pd.Series(_map_unique(series, str), index=series.index, dtype='string')
+
+
+def build_entries_table(normalized):
+    """Return the entries of every project, grouped by project in order of first appearance
+
+    Durations are integer seconds (as shown in projects.xlsx) and start/end are timestamps.
+    """
+    codes, _ = pd.factorize(normalized['Project'])
+    order = np.argsort(codes, kind='stable')
+    order = order[codes[order] >= 0]
+    entries = normalized.iloc[order]
+
+    table = pd.DataFrame({
+        'Project': _text_column(entries['Project']),
+        'Description': _text_column(entries['Description']),
+        'User': _text_column(entries['User']),
+        'Email': _text_column(entries['Email']),
+        'Start': entries['start'],
+        'End': entries['end'],
+        'Duration (seconds)': entries['duration_seconds'],
+    })
+    if 'rounded_duration_seconds' in entries.columns:
+        table['Rounded (seconds)'] = entries['rounded_duration_seconds']
+    return table.reset_index(drop=True)
+
+
+def build_totals_table(normalized):
+    """Return the (user, project, description) totals in integer seconds, as summed for hr.xlsx
+
+    Rows are sorted by user then project, with descriptions in order of first
+    appearance. Entries without a description are kept as an empty description.
+    """
+    keys = ['User', 'Project', 'Description']
+    grouped = normalized[normalized['User'].notna() & normalized['Project'].notna()]
+    if 'description_group' in grouped.columns:
+        grouped = grouped.assign(Description=grouped['description_group'])
+    aggregations = {'sum': ('seconds', 'sum'), 'size': ('seconds', 'size')}
+    if 'rounded_seconds' in normalized.columns:
+        aggregations['rounded'] = ('rounded_seconds', 'sum')
+    totals = grouped.groupby(keys, sort=False, dropna=False, observed=True).agg(**aggregations).reset_index()
+    totals = totals.sort_values(['User', 'Project'], kind='stable')
+
+    table = pd.DataFrame({
+        'User': _text_column(totals['User']),
+        'Project': _text_column(totals['Project']),
+        'Description': _text_column(totals['Description']),
+        'Entries': totals['size'].astype(np.int64),
+        'Seconds': totals['sum'].astype(np.int64),
+    })
+    if 'rounded' in totals.columns:
+        table['Rounded Seconds'] = totals['rounded'].astype(np.int64)
+    return table.reset_index(drop=True)
+
+
+def write_table(table, file_path, fmt):
+    """Write a table as CSV, JSON Lines or Parquet (Parquet needs pyarrow)"""
+    if fmt == 'csv':
+        table.to_csv(file_path, index=False, date_format='%Y-%m-%dT%H:%M:%S')
+    elif fmt == 'jsonl':
+        table.to_json(file_path, orient='records', lines=True, date_format='iso')
+    elif fmt == 'parquet':
+        table.to_parquet(file_path, index=False)
+    else:
+        raise ValueError(f"Unknown table format: {fmt}")
+
+
+def prepare_report(df, rules=None, grouping=None):
+    """Normalize a report, then apply optional rounding rules and description grouping"""
+    normalized = normalize_report(df)
+    if rules:
+        normalized = rounding.apply_rounding(normalized, rules)
+    if grouping is not None:
+        normalized = description_groups.apply_grouping(normalized, grouping)
+    return normalized
+
+
+def export_tables(df, output_dir, fmt, normalized=None, rules=None, grouping=None):
+    """Write project_entries and description_totals tables to output_dir, returning their paths
+
+    rules are optional rounding.RoundingRules adding rounded seconds to both
+    tables, grouping an optional description_groups.DescriptionGrouping
+    merging descriptions in description_totals.
+    """
+    if fmt not in TABLE_FORMATS:
+        raise ValueError(f"Unknown table format: {fmt}")
+    if normalized is None:
+        normalized = prepare_report(df, rules, grouping)
+
+    os.makedirs(output_dir, exist_ok=True)
+    paths = []
+    for name, table in [('project_entries', build_entries_table(normalized)),
+                        ('description_totals', build_totals_table(normalized))]:
+        file_path = os.path.join(output_dir, f"{name}.{fmt}")
+        write_table(table, file_path, fmt)
+        paths.append(file_path)
+    return paths
+
+
+def _register_styles(book):
+    """Add the named styles used by numeric workbooks, once per workbook"""
+    total_font = Font(bold=True)
+    total_fill = PatternFill(fill_type='solid', fgColor='D8DEE9')
+    styles = [
+        NamedStyle('Duration', number_format=DURATION_FORMAT),
+        NamedStyle('Subtotal', font=Font(bold=True)),
+        NamedStyle('Subtotal Duration', font=Font(bold=True), number_format=DURATION_FORMAT),
+        NamedStyle('Total', font=total_font, fill=total_fill),
+        NamedStyle('Total Duration', font=total_font, fill=total_fill, number_format=DURATION_FORMAT),
+    ]
+    for style in styles:
+        if style.name not in book.named_styles:
+            book.add_named_style(style)
+
+
+def _style_sheet(worksheet, sheet):
+    """Apply the named styles to a numeric sheet"""
+    width = len(sheet.frame.columns)
+    last_row = len(sheet.frame) + 1
+    durations = {i + 1 for i, column in enumerate(sheet.frame.columns) if column in DURATION_COLUMNS}
+
+    # Row 1 is the header, so frame row i is worksheet row i + 2
+    for col in durations:
+        for row in range(2, last_row):
+            worksheet.cell(row=row, column=col).style = 'Duration'
+    for i in sheet.subtotal_rows:
+        for col in range(1, width + 1):
+            worksheet.cell(row=i + 2, column=col).style = 'Subtotal Duration' if col in durations else 'Subtotal'
+    for col in range(1, width + 1):
+        worksheet.cell(row=last_row, column=col).style = 'Total Duration' if col in durations else 'Total'
+
+
+def write_workbook(file_path, sheets, numeric=False):
+    """Write sheets to an Excel workbook, returning the number of sheets written
+
+    With numeric=True the duration column gets the [h]:mm:ss number format and
+    subtotal/total rows are highlighted using named styles shared by the workbook.
+    """
+    with pd.ExcelWriter(file_path, engine='openpyxl') as writer:
+        if numeric:
+            _register_styles(writer.book)
+        for sheet in sheets:
+            sheet.frame.to_excel(writer, sheet_name=sheet.name, index=False)
+            if numeric:
+                _style_sheet(writer.sheets[sheet.name], sheet)
+    return len(sheets)
+
+
+def output_path(directory, name, sharded=False, as_zip=False):
+    """Return where a report named name is written in directory
+
+    A single workbook is name.xlsx, a sharded output is the name folder or name.zip.
+    """
+    if not sharded:
+        return os.path.join(directory, f"{name}.xlsx")
+    return os.path.join(directory, f"{name}.zip" if as_zip else name)
+
+
+def _workbook_bytes(sheets, numeric=False):
+    """Write sheets to an in-memory Excel workbook and return its bytes"""
+    buffer = io.BytesIO()
+    write_workbook(buffer, sheets, numeric)
+    return buffer.getvalue()
+
+
+def shard_file_names(sheets):
+    """Return a unique, file system safe .xlsx file name for each sheet
+
+    Names come from the full user or project name rather than the sheet name,
+    which Excel limits to 31 characters.
+    """
+    file_names = []
+    used = set()
+    for sheet in sheets:
+        label = str(sheet.label) if sheet.label is not None else sheet.name
+        base = re.sub(r'[<>:"/\\|?*\x00-\x1f]', '_', label)[:MAX_SHARD_NAME].strip().rstrip('.') or 'Sheet'
+        name = base
+        suffix = 2
+        # Distinct names may still clash once sanitized, and file names ignore case on Windows
+        while name.lower() in used:
+            name = f"{base} ({suffix})"
+            suffix += 1
+        used.add(name.lower())
+        file_names.append(f"{name}.xlsx")
+    return file_names
+
+
+def build_manifest(sheets, file_names):
+    """Return the manifest of a sharded output: one row with the totals of each shard"""
+    manifest = pd.DataFrame({
+        'File': file_names,
+        'Name': [sheet.label if sheet.label is not None else sheet.name for sheet in sheets],
+        # Every sheet ends with a blank row and a total row
+        'Rows': [len(sheet.frame) - 2 for sheet in sheets],
+        'Total (h)': [format_seconds(sheet.total_seconds) for sheet in sheets],
+        'Total (seconds)': [sheet.total_seconds for sheet in sheets],
+    })
+    if any(sheet.rounded_seconds is not None for sheet in sheets):
+        manifest['Rounded (h)'] = [format_seconds(sheet.rounded_seconds or 0) for sheet in sheets]
+        manifest['Rounded (seconds)'] = [sheet.rounded_seconds or 0 for sheet in sheets]
+    return manifest
+
+
+def _run_tasks(tasks):
+    """Run (func, args) tasks in worker processes, yielding (index, result) as they finish"""
+    if len(tasks) < 2:
+        # Not worth starting worker processes for a single workbook
+        for i, (func, args) in enumerate(tasks):
+            yield i, func(*args)
+        return
+
+    with ProcessPoolExecutor(max_workers=min(len(tasks), os.cpu_count() or 1)) as executor:
+        futures = {executor.submit(func, *args): i for i, (func, args) in enumerate(tasks)}
+        for future in as_completed(futures):
+            # Re-raise any error from the worker process
+            yield futures[future], future.result()
+
+
+def write_outputs(targets, progress=None, numeric=False):
+    """Write several workbooks and sharded outputs concurrently
+
+    targets is a list of (output, sheets, sharded) tuples. An unsharded target
+    writes all its sheets to the output workbook. A sharded target writes one
+    workbook per sheet into the output folder, or streams them into a zip
+    archive if output ends with .zip, along with manifest.csv holding the
+    totals of each shard. Workbooks are written in separate processes since
+    openpyxl is pure Python and holds the GIL. progress is called with the
+    fraction of rows written so far.
+
+    Returns the manifests of the sharded targets keyed by output.
+    """
+    tasks = []
+    weights = []
+    # Zip archive and entry name of the tasks returning workbook bytes
+    entries = {}
+    archives = {}
+    manifests = {}
+
+    try:
+        for output, sheets, sharded in targets:
+            if not sharded:
+                tasks.append((write_workbook, (output, sheets, numeric)))
+                weights.append(sum(len(sheet.frame) for sheet in sheets))
+                continue
+
+            file_names = shard_file_names(sheets)
+            manifests[output] = build_manifest(sheets, file_names)
+            if output.lower().endswith('.zip'):
+                # Workbooks are already compressed, so they are stored as is
+                archives[output] = zipfile.ZipFile(output, 'w', zipfile.ZIP_STORED)
+                archives[output].writestr(SHARD_MANIFEST, manifests[output].to_csv(index=False))
+            else:
+                os.makedirs(output, exist_ok=True)
+                manifests[output].to_csv(os.path.join(output, SHARD_MANIFEST), index=False)
+
+            for sheet, file_name in zip(sheets, file_names):
+                if output in archives:
+                    entries[len(tasks)] = (archives[output], file_name)
+                    tasks.append((_workbook_bytes, ([sheet], numeric)))
+                else:
+                    tasks.append((write_workbook, (os.path.join(output, file_name), [sheet], numeric)))
+                weights.append(len(sheet.frame))
+
+        total_weight = sum(weights) or 1
+        done_weight = 0
+        for i, result in _run_tasks(tasks):
+            if i in entries:
+                archive, file_name = entries[i]
+                archive.writestr(file_name, result)
+            done_weight += weights[i]
+            if progress:
+                progress(done_weight / total_weight)
+    finally:
+        for archive in archives.values():
+            archive.close()
+
+    return manifests
+
+
+def export_all(df, projects_output, hr_output, progress=None, numeric=False,
+               shard_projects=False, shard_hr=False, rules=None, grouping=None):
+    """Normalize and aggregate a report once, then write projects.xlsx and hr.xlsx concurrently
+
+    progress is called with a percentage between 0 and 100. numeric=True writes
+    durations as Excel time values instead of HH:MM:SS strings. shard_projects
+    and shard_hr write one workbook per project/user into the given output
+    folder (or .zip archive) instead of a single workbook. rules are optional
+    rounding.RoundingRules applied to every entry before aggregating, grouping
+    an optional description_groups.DescriptionGrouping used by hr.xlsx.
+    """
+    def report(value):
+        if progress:
+            progress(value)
+
+    report(5)
+    normalized = prepare_report(df, rules, grouping)
+    report(20)
+
+    project_sheets = build_project_sheets(normalized, numeric)
+    report(30)
+    hr_sheets = build_hr_sheets(normalized, report_date_range(df), numeric)
+    report(40)
+
+    write_outputs(
+        [(projects_output, project_sheets, shard_projects), (hr_output, hr_sheets, shard_hr)],
+        progress=lambda fraction: report(40 + fraction * 60),
+        numeric=numeric
+    )
+    return project_sheets, hr_sheets
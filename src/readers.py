@@ -0,0 +1,105 @@
+import importlib.util
+import os
+import time
+from collections import namedtuple
+
+import pandas as pd
+
+import pipeline
+
+# A spreadsheet reader: engine name, file extensions it reads, module it needs,
+# minimum pandas version, an optional read function (defaults to pd.read_excel)
+# and whether it stops parsing after nrows rows (used for quick previews)
+ReaderEngine = namedtuple('ReaderEngine', ['name', 'extensions', 'module', 'min_pandas', 'read', 'streaming'],
+                          defaults=[(0, 0), None, False])
+
+# Result of loading a report: the data, the engine used and the load time in seconds
+ReadResult = namedtuple('ReadResult', ['frame', 'engine', 'seconds'])
+
+# Engines in order of preference. calamine (Rust) is much faster than the pure
+# Python readers, which are kept as fallbacks. openpyxl reads row by row, so it
+# returns the first rows of a large workbook without parsing the rest.
+ENGINES = [
+    ReaderEngine('calamine', ('.xlsx', '.xlsm', '.xls', '.xlsb', '.ods'), 'python_calamine', (2, 2)),
+    ReaderEngine('openpyxl', ('.xlsx', '.xlsm'), 'openpyxl', streaming=True),
+    ReaderEngine('xlrd', ('.xls',), 'xlrd'),
+]
+
+
+def register_engine(engine, preferred=False):
+    """Add a reader engine, either as the preferred one or as the last fallback"""
+    if preferred:
+        ENGINES.insert(0, engine)
+    else:
+        ENGINES.append(engine)
+
+
+def _pandas_version():
+    return tuple(int(part) for part in pd.__version__.split('.')[:2])
+
+
+def is_available(engine):
+    """Return True if the engine's module is installed and pandas supports it"""
+    return (_pandas_version() >= engine.min_pandas
+            and importlib.util.find_spec(engine.module) is not None)
+
+
+def available_engines(file_path):
+    """Return the names of the engines able to read file_path, fastest first"""
+    extension = os.path.splitext(file_path)[1].lower()
+    return [engine.name for engine in ENGINES if extension in engine.extensions and is_available(engine)]
+
+
+def select_engine(file_path):
+    """Return the name of the fastest available engine for file_path"""
+    engines = available_engines(file_path)
+    if not engines:
+        extension = os.path.splitext(file_path)[1].lower()
+        raise ValueError(f"No spreadsheet reader available for {extension} files")
+    return engines[0]
+
+
+def read_report(file_path, engine=None, **kwargs):
+    """Load a report with the given engine (or the fastest available one), timing the load
+
+    Extra keyword arguments are passed to the engine's read function.
+    """
+    if engine is None:
+        engine = select_engine(file_path)
+    reader = next((candidate for candidate in ENGINES if candidate.name == engine), None)
+
+    start = time.perf_counter()
+    if reader is not None and reader.read is not None:
+        frame = reader.read(file_path, **kwargs)
+    else:
+        frame = pd.read_excel(file_path, engine=engine, **kwargs)
+    return ReadResult(frame, engine, time.perf_counter() - start)
+
+
+def read_preview(file_path, rows):
+    """Load the header and first rows of a report, preferring an engine that stops parsing there"""
+    engines = available_engines(file_path)
+    streaming = [engine.name for engine in ENGINES if engine.streaming and engine.name in engines]
+    engine = streaming[0] if streaming else select_engine(file_path)
+    return read_report(file_path, engine, nrows=rows)
+
+
+def benchmark_readers(file_path):
+    """Load a report with every available engine
+
+    Returns (engine, seconds, rows, identical) tuples, where identical tells
+    whether the normalized report matches the one from the fastest engine.
+    """
+    results = []
+    reference = None
+    for engine in available_engines(file_path):
+        result = read_report(file_path, engine)
+        try:
+            normalized = pipeline.normalize_report(result.frame)
+        except KeyError:
+            # Not a report the exports can process, compare the raw data instead
+            normalized = result.frame
+        if reference is None:
+            reference = normalized
+        results.append((engine, result.seconds, len(result.frame), normalized.equals(reference)))
+    return results
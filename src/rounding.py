@@ -0,0 +1,124 @@
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+# Rounding modes: up to, down to, or to the nearest multiple of the interval
+ROUNDING_MODES = ['up', 'down', 'nearest']
+
+# A rounding rule: mode and interval in seconds
+Rule = namedtuple('Rule', ['mode', 'seconds'])
+
+RULES_HELP = (
+    "One rule per line, e.g.\n"
+    "default: up 15\n"
+    "project Client A: nearest 6\n"
+    "user Jane Doe: down 6\n"
+    "Intervals are in minutes. Project rules take precedence over user rules, "
+    "which take precedence over the default. Lines starting with # are ignored."
+)
+
+
+class RoundingRules:
+    """Per-entry billing rounding rules, with optional overrides per project and per user"""
+
+    def __init__(self, default=None, projects=None, users=None):
+        self.default = default
+        self.projects = projects or {}
+        self.users = users or {}
+
+    def __bool__(self):
+        return self.default is not None or bool(self.projects) or bool(self.users)
+
+    @classmethod
+    def parse(cls, text):
+        """Parse rules written as 'scope: mode minutes' lines (see RULES_HELP)"""
+        rules = cls()
+        for line_number, line in enumerate(text.splitlines(), start=1):
+            # Only whole lines are comments, names may contain '#'
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+
+            # Project and user names may contain colons, so split on the last one
+            scope, separator, rule_text = line.rpartition(':')
+            if not separator:
+                raise ValueError(f"Rounding rule line {line_number}: expected 'scope: mode minutes'")
+            rule = cls._parse_rule(rule_text, line_number)
+
+            scope = scope.strip()
+            kind, _, name = scope.partition(' ')
+            kind = kind.lower()
+            if kind == 'default' and not name:
+                rules.default = rule
+            elif kind == 'project' and name.strip():
+                rules.projects[name.strip()] = rule
+            elif kind == 'user' and name.strip():
+                rules.users[name.strip()] = rule
+            else:
+                raise ValueError(f"Rounding rule line {line_number}: unknown scope '{scope}'")
+        return rules
+
+    @staticmethod
+    def _parse_rule(text, line_number):
+        """Parse 'mode minutes' into a Rule"""
+        parts = text.split()
+        if len(parts) != 2 or parts[0].lower() not in ROUNDING_MODES:
+            raise ValueError(f"Rounding rule line {line_number}: expected one of {', '.join(ROUNDING_MODES)} and minutes")
+        try:
+            minutes = float(parts[1])
+        except ValueError:
+            raise ValueError(f"Rounding rule line {line_number}: invalid minutes '{parts[1]}'")
+        if minutes <= 0:
+            raise ValueError(f"Rounding rule line {line_number}: minutes must be positive")
+        return Rule(parts[0].lower(), int(round(minutes * 60)))
+
+    def rule_arrays(self, normalized):
+        """Return the interval (0 = no rounding) and mode code of every entry
+
+        Rules are looked up once per distinct project and user and broadcast
+        back to the rows through their factorized codes.
+        """
+        intervals = np.zeros(len(normalized), dtype=np.int64)
+        modes = np.zeros(len(normalized), dtype=np.int64)
+        if self.default is not None:
+            intervals[:] = self.default.seconds
+            modes[:] = ROUNDING_MODES.index(self.default.mode)
+
+        # User rules first so project rules override them
+        for column, table in (('User', self.users), ('Project', self.projects)):
+            if not table:
+                continue
+            codes, uniques = pd.factorize(normalized[column])
+            rules = [table.get(str(value)) for value in uniques] + [None]
+            rule_intervals = np.array([rule.seconds if rule else -1 for rule in rules], dtype=np.int64)[codes]
+            rule_modes = np.array([ROUNDING_MODES.index(rule.mode) if rule else 0 for rule in rules], dtype=np.int64)[codes]
+            has_rule = rule_intervals >= 0
+            intervals = np.where(has_rule, rule_intervals, intervals)
+            modes = np.where(has_rule, rule_modes, modes)
+        return intervals, modes
+
+
+def round_seconds(seconds, intervals, modes):
+    """Round integer seconds to their entry's interval (arrays of the same length)"""
+    seconds = np.asarray(seconds, dtype=np.int64)
+    step = np.where(intervals > 0, intervals, 1)
+    up = -(-seconds // step) * step
+    down = seconds // step * step
+    nearest = (seconds + step // 2) // step * step
+    rounded = np.select([modes == 0, modes == 1], [up, down], nearest)
+    return np.where(intervals > 0, rounded, seconds)
+
+
+def apply_rounding(normalized, rules):
+    """Add rounded copies of the normalized second columns, ready for aggregation
+
+    Adds rounded_seconds, rounded_rollup_seconds and rounded_duration_seconds.
+    The exports add 'Rounded (h)' columns next to the raw totals when they are present.
+    """
+    intervals, modes = rules.rule_arrays(normalized)
+    return normalized.assign(
+        rounded_seconds=round_seconds(normalized['seconds'], intervals, modes),
+        rounded_rollup_seconds=round_seconds(normalized['rollup_seconds'], intervals, modes),
+        rounded_duration_seconds=round_seconds(normalized['duration_seconds'], intervals, modes),
+    )
@@ -0,0 +1,104 @@
+import re
+from bisect import bisect_left
+
+import numpy as np
+import pandas as pd
+
+TOKEN_PATTERN = re.compile(r'\w+')
+
+
+def tokenize(text):
+    """Split text into lowercase word tokens"""
+    return TOKEN_PATTERN.findall(str(text).lower())
+
+
+class ReportIndex:
+    """Search indexes over an imported report, built once so filtering never rescans strings
+
+    Descriptions are factorized and tokenized once per distinct value into an
+    inverted index (token -> description codes). Users and projects are kept as
+    integer code arrays and start dates as int64 nanoseconds, so every filter is
+    a vectorized comparison over the rows.
+    """
+
+    def __init__(self, df):
+        self.row_count = len(df)
+
+        # Description tokens -> codes of the distinct descriptions containing them
+        if 'Description' in df.columns:
+            self.description_codes, descriptions = pd.factorize(df['Description'])
+        else:
+            self.description_codes, descriptions = np.full(len(df), -1), []
+        self.description_count = len(descriptions)
+        postings = {}
+        for code, description in enumerate(descriptions):
+            for token in set(tokenize(description)):
+                postings.setdefault(token, []).append(code)
+        self.vocabulary = sorted(postings)
+        self.postings = [np.array(postings[token], dtype=np.int64) for token in self.vocabulary]
+
+        # Categorical facets as integer codes
+        self.user_codes, self.users = self._factorize(df, 'User')
+        self.project_codes, self.projects = self._factorize(df, 'Project')
+        self.user_lookup = {label: code for code, label in enumerate(self.users)}
+        self.project_lookup = {label: code for code, label in enumerate(self.projects)}
+
+        # Start dates as int64 nanoseconds (NaT is the minimum int64 value)
+        if 'Start Date' in df.columns:
+            dates = pd.to_datetime(df['Start Date'], dayfirst=True, errors='coerce')
+        else:
+            dates = pd.Series(pd.NaT, index=df.index, dtype='datetime64[ns]')
+        self.dates = dates.to_numpy(dtype='datetime64[ns]').view(np.int64)
+        valid_dates = dates.dropna()
+        self.min_date = valid_dates.min() if not valid_dates.empty else None
+        self.max_date = valid_dates.max() if not valid_dates.empty else None
+
+    @staticmethod
+    def _factorize(df, column):
+        """Return integer codes and labels (sorted as text) for a categorical column"""
+        if column not in df.columns:
+            return np.full(len(df), -1), []
+        codes, uniques = pd.factorize(df[column])
+        labels = [str(value) for value in uniques]
+        order = sorted(range(len(labels)), key=labels.__getitem__)
+
+        # Renumber the codes to follow the sorted labels, keeping -1 for missing values
+        remap = np.full(len(labels) + 1, -1)
+        remap[order] = np.arange(len(labels))
+        return remap[codes], [labels[i] for i in order]
+
+    def _matching_descriptions(self, term):
+        """Return a mask of the distinct descriptions with a token starting with term"""
+        mask = np.zeros(self.description_count + 1, dtype=bool)
+        i = bisect_left(self.vocabulary, term)
+        while i < len(self.vocabulary) and self.vocabulary[i].startswith(term):
+            mask[self.postings[i]] = True
+            i += 1
+        return mask
+
+    def search(self, text="", user=None, project=None, start=None, end=None):
+        """Return the positions of the rows matching every given filter
+
+        text matches descriptions containing a word starting with each of its
+        terms, user and project are exact labels, start and end bound the start
+        date (inclusive).
+        """
+        mask = np.ones(self.row_count, dtype=bool)
+
+        for term in tokenize(text):
+            # The extra trailing slot is False so rows without a description (code -1) never match
+            mask &= self._matching_descriptions(term)[self.description_codes]
+
+        # Unknown labels map to -2, which matches no row
+        if user is not None:
+            mask &= self.user_codes == self.user_lookup.get(user, -2)
+        if project is not None:
+            mask &= self.project_codes == self.project_lookup.get(project, -2)
+
+        if start is not None:
+            mask &= self.dates >= pd.Timestamp(start).value
+        if end is not None:
+            # Include the whole end day
+            mask &= (self.dates != np.iinfo(np.int64).min) & (self.dates < (pd.Timestamp(end) + pd.Timedelta(days=1)).value)
+
+        return np.flatnonzero(mask)